@@ -6,7 +6,9 @@ Demonstrates:
 - Loading config with custom states (state packs)
 - Subscribing to observability events
 - Restoring from SQLite if previous state exists
-- Saving snapshots on state changes
+- Recording state transitions (full snapshots only when rules change),
+  batched into one transaction per burst
+- WAL journaling with synchronous=NORMAL for cheaper commits
 - Periodic pruning for retention
 
 Run: python app.py
@@ -17,7 +19,9 @@ from __future__ import annotations
 import asyncio
 import sqlite3
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Union
 
 # Add the example directory to path so config can find states module
 sys.path.insert(0, str(Path(__file__).parent))
@@ -27,12 +31,119 @@ from flexiflow.config_loader import ConfigLoader
 from flexiflow.engine import FlexiFlowEngine
 from flexiflow.extras import (
     ComponentSnapshot,
+    configure_connection_sqlite,
     load_latest_snapshot_sqlite,
     prune_snapshots_sqlite,
-    save_snapshot_sqlite,
+    prune_transitions_sqlite,
+    save_snapshots_sqlite,
+    save_transitions_sqlite,
 )
 from flexiflow.state_machine import StateMachine
 
+# Snapshot batching: flush when this many are queued, or after the queue
+# has been idle for SNAPSHOT_FLUSH_INTERVAL seconds.
+SNAPSHOT_BATCH_SIZE = 32
+SNAPSHOT_FLUSH_INTERVAL = 0.05
+
+# Retention: prune every PRUNE_INTERVAL seconds, or as soon as
+# PRUNE_AFTER_WRITES rows have been written since the last prune.
+PRUNE_INTERVAL = 60.0
+PRUNE_AFTER_WRITES = 1000
+KEEP_LAST = 50
+
+# Demo messages are built once and reused for every send
+MSG_START_JOB = {"type": "start_job"}
+MSG_COMPLETE = {"type": "complete"}
+MSG_RESET = {"type": "reset"}
+MSG_FAIL = {"type": "fail"}
+MSG_RETRY = {"type": "retry"}
+
+
+@dataclass(frozen=True)
+class Transition:
+    """A state change to record without rewriting the rules."""
+
+    name: str
+    to_state: str
+
+
+PersistItem = Union[ComponentSnapshot, Transition]
+
+
+class PruneScheduler:
+    """Runs retention off the write path, on a timer or after many writes."""
+
+    def __init__(self, conn: sqlite3.Connection, component_name: str) -> None:
+        self.conn = conn
+        self.component_name = component_name
+        self.writes_since_prune = 0
+        self._due = asyncio.Event()
+
+    def record_writes(self, count: int) -> None:
+        self.writes_since_prune += count
+        if self.writes_since_prune >= PRUNE_AFTER_WRITES:
+            self._due.set()
+
+    def prune(self) -> None:
+        self._due.clear()
+        self.writes_since_prune = 0
+        prune_snapshots_sqlite(self.conn, self.component_name, keep_last=KEEP_LAST)
+        prune_transitions_sqlite(self.conn, self.component_name, keep_last=KEEP_LAST)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._due.wait(), timeout=PRUNE_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self.prune()
+
+
+def flush_snapshots(conn: sqlite3.Connection, batch: list[PersistItem]) -> None:
+    """Write a batch of transitions/snapshots in a single transaction."""
+    transitions = [(t.name, t.to_state) for t in batch if isinstance(t, Transition)]
+    snapshots = [s for s in batch if isinstance(s, ComponentSnapshot)]
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if snapshots:
+            save_snapshots_sqlite(conn, snapshots, commit=False)
+        if transitions:
+            save_transitions_sqlite(conn, transitions, commit=False)
+    except Exception:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+async def snapshot_writer(
+    conn: sqlite3.Connection,
+    queue: asyncio.Queue[PersistItem],
+    pruner: PruneScheduler,
+) -> None:
+    """Drain queued snapshots and flush them in bursts."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < SNAPSHOT_BATCH_SIZE:
+            try:
+                batch.append(
+                    await asyncio.wait_for(queue.get(), timeout=SNAPSHOT_FLUSH_INTERVAL)
+                )
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            flush_snapshots(conn, batch)
+        except Exception as e:
+            # Keep draining: an exception here would end the task and leave
+            # queue.join() waiting forever. This burst is lost.
+            print(f"Warning: failed to persist {len(batch)} record(s): {e}")
+        else:
+            pruner.record_writes(len(batch))
+        finally:
+            for _ in batch:
+                queue.task_done()
+
 
 async def main():
     # --- Setup ---
@@ -42,8 +153,12 @@ async def main():
     # Load config (registers all custom states from states: mapping)
     config = ConfigLoader.load_component_config(config_path)
 
-    # Connect to SQLite
+    # Connect to SQLite (WAL + synchronous=NORMAL: one writer, fewer fsyncs)
     conn = sqlite3.connect(db_path)
+    journal_mode = configure_connection_sqlite(conn)
+    if journal_mode != "wal":
+        print(f"Warning: WAL not available, using journal_mode={journal_mode}")
+    conn.execute("PRAGMA mmap_size=268435456")
 
     # Create engine
     engine = FlexiFlowEngine()
@@ -55,78 +170,99 @@ async def main():
         print(f"Restored from snapshot: {snapshot.current_state}")
         component = AsyncComponent(
             name=snapshot.name,
-            rules=list(snapshot.rules),
+            rules=snapshot.rules,
             state_machine=StateMachine.from_name(snapshot.current_state),
         )
     else:
         print(f"Starting fresh: {config.initial_state}")
         component = AsyncComponent(
             name=config.name,
-            rules=list(config.rules),
+            rules=config.rules,
             state_machine=StateMachine.from_name(config.initial_state),
         )
 
     engine.register(component)
 
+    # --- Persistence: Batched Snapshot Writer ---
+    snapshot_queue: asyncio.Queue[PersistItem] = asyncio.Queue()
+    pruner = PruneScheduler(conn, component.name)
+    writer = asyncio.create_task(snapshot_writer(conn, snapshot_queue, pruner))
+    prune_task = asyncio.create_task(pruner.run())
+
+    def queue_full_snapshot(triggered_by: str) -> None:
+        snapshot_queue.put_nowait(
+            ComponentSnapshot(
+                name=component.name,
+                current_state=component.current_state_name,
+                rules=component.rules,
+                metadata={"triggered_by": triggered_by},
+            )
+        )
+
+    # Fresh components need a full snapshot as the base for later transitions
+    if not snapshot:
+        queue_full_snapshot("initial")
+
     # --- Observability: Log State Changes ---
+    def record_transition(name: str, from_state: str, to_state: str) -> None:
+        print(f"  [{name}] {from_state} -> {to_state}")
+
+        # Only the transition is recorded; the rules are unchanged
+        snapshot_queue.put_nowait(Transition(name, to_state))
+
     async def on_state_changed(data):
-        print(f"  [{data['component']}] {data['from_state']} -> {data['to_state']}")
-
-        # Save snapshot on every state change
-        snapshot = ComponentSnapshot(
-            name=data["component"],
-            current_state=data["to_state"],
-            rules=component.rules,
-            metadata={"triggered_by": "state_change"},
-        )
-        save_snapshot_sqlite(conn, snapshot)
+        record_transition(data["component"], data["from_state"], data["to_state"])
+
+    async def on_state_changed_batch(data):
+        for t in data["transitions"]:
+            record_transition(data["component"], t["from_state"], t["to_state"])
 
-        # Prune old snapshots (keep last 50)
-        prune_snapshots_sqlite(conn, data["component"], keep_last=50)
+    async def on_rules_updated(data):
+        # Rules changed: write a full snapshot carrying the new rules
+        queue_full_snapshot("rules_updated")
 
     await engine.event_bus.subscribe(
         "state.changed", "observer", on_state_changed, priority=5
     )
+    await engine.event_bus.subscribe(
+        "state.changed.batch", "observer", on_state_changed_batch, priority=5
+    )
+    await engine.event_bus.subscribe(
+        "component.rules.updated", "observer", on_rules_updated, priority=5
+    )
 
     # --- Demo: Simulate a Job Workflow ---
     print("\n--- Running job workflow demo ---\n")
 
-    print("Current state:", component.state_machine.current_state.__class__.__name__)
+    print("Current state:", component.current_state_name)
 
     # Start a job
     print("\nSending: start_job")
-    await component.handle_message({"type": "start_job"})
-
-    # Complete it
-    print("Sending: complete")
-    await component.handle_message({"type": "complete"})
-
-    # Reset to idle
-    print("Sending: reset")
-    await component.handle_message({"type": "reset"})
-
-    # Start another job that fails
-    print("Sending: start_job")
-    await component.handle_message({"type": "start_job"})
+    await component.handle_message(MSG_START_JOB)
 
-    print("Sending: fail")
-    await component.handle_message({"type": "fail"})
+    # Observers only queue records; yield once so the writer task can start
+    # flushing them while the demo carries on.
+    await asyncio.sleep(0)
 
-    # Retry
-    print("Sending: retry")
-    await component.handle_message({"type": "retry"})
+    # Complete, reset, then a job that fails, is retried and completes.
+    # handle_many runs them in one call and publishes a single batch event.
+    workflow = [MSG_COMPLETE, MSG_RESET, MSG_START_JOB, MSG_FAIL, MSG_RETRY, MSG_COMPLETE]
+    print("Sending batch:", ", ".join(m["type"] for m in workflow))
+    await component.handle_many(workflow)
 
-    # Complete
-    print("Sending: complete")
-    await component.handle_message({"type": "complete"})
+    print(f"\nFinal state: {component.current_state_name}")
 
-    print(f"\nFinal state: {component.state_machine.current_state.__class__.__name__}")
+    # Flush any pending writes before reading history
+    await snapshot_queue.join()
+    writer.cancel()
+    prune_task.cancel()
+    pruner.prune()
 
     # --- Show History ---
-    from flexiflow.extras import list_snapshots_sqlite
+    from flexiflow.extras import list_transitions_sqlite
 
-    print("\n--- Snapshot History (last 5) ---")
-    history = list_snapshots_sqlite(conn, config.name, limit=5)
+    print("\n--- Transition History (last 5) ---")
+    history = list_transitions_sqlite(conn, config.name, limit=5)
     for entry in history:
         print(f"  {entry['id']}: {entry['current_state']} at {entry['created_at']}")
 
@@ -1,8 +1,13 @@
-"""Custom states for the embedded app example."""
+"""Custom states for the embedded app example.
+
+The states carry no per-instance data, so each transition returns a shared
+module-level instance instead of constructing a new one. Each state's
+transitions are a message-type -> next-state table, looked up once per message.
+"""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Tuple
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple
 
 from flexiflow.state_machine import State
 
@@ -10,54 +15,43 @@ if TYPE_CHECKING:
     from flexiflow.component import AsyncComponent
 
 
-class Idle(State):
-    """Initial state - waiting for work."""
+class JobState(State):
+    """Base for the example states: dispatch on message type via TRANSITIONS."""
+
+    TRANSITIONS: ClassVar[Dict[str, State]] = {}
 
     async def handle_message(
         self, message: Dict[str, Any], component: "AsyncComponent"
     ) -> Tuple[bool, State]:
-        if message.get("type") == "start_job":
-            return True, Processing()
-        return False, self
+        nxt = self.TRANSITIONS.get(message.get("type"))
+        if nxt is None:
+            return False, self
+        return True, nxt
 
 
-class Processing(State):
-    """Actively processing a job."""
-
-    async def handle_message(
-        self, message: Dict[str, Any], component: "AsyncComponent"
-    ) -> Tuple[bool, State]:
-        msg_type = message.get("type")
+class Idle(JobState):
+    """Initial state - waiting for work."""
 
-        if msg_type == "complete":
-            return True, Complete()
-        if msg_type == "fail":
-            return True, Failed()
-        if msg_type == "cancel":
-            return True, Idle()
 
-        return False, self
+class Processing(JobState):
+    """Actively processing a job."""
 
 
-class Complete(State):
+class Complete(JobState):
     """Job completed successfully."""
 
-    async def handle_message(
-        self, message: Dict[str, Any], component: "AsyncComponent"
-    ) -> Tuple[bool, State]:
-        if message.get("type") == "reset":
-            return True, Idle()
-        return False, self
 
-
-class Failed(State):
+class Failed(JobState):
     """Job failed."""
 
-    async def handle_message(
-        self, message: Dict[str, Any], component: "AsyncComponent"
-    ) -> Tuple[bool, State]:
-        if message.get("type") == "retry":
-            return True, Processing()
-        if message.get("type") == "reset":
-            return True, Idle()
-        return False, self
+
+# Shared instances returned by transitions (states are stateless)
+IDLE = Idle()
+PROCESSING = Processing()
+COMPLETE = Complete()
+FAILED = Failed()
+
+Idle.TRANSITIONS = {"start_job": PROCESSING}
+Processing.TRANSITIONS = {"complete": COMPLETE, "fail": FAILED, "cancel": IDLE}
+Complete.TRANSITIONS = {"reset": IDLE}
+Failed.TRANSITIONS = {"retry": PROCESSING, "reset": IDLE}
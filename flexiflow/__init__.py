@@ -23,7 +23,7 @@ For config-driven usage:
     config = ConfigLoader.load_component_config("config.yaml")
     component = AsyncComponent(
         name=config.name,
-        rules=list(config.rules),
+        rules=config.rules,
         state_machine=StateMachine.from_name(config.initial_state),
     )
 """
@@ -47,7 +47,7 @@ async def cmd_register(args) -> None:
 
     component = AsyncComponent(
         name=cfg.name,
-        rules=list(cfg.rules),
+        rules=cfg.rules,
         state_machine=StateMachine.from_name(cfg.initial_state),
         logger=logger,
     )
@@ -66,7 +66,7 @@ async def cmd_handle(args) -> None:
 
     component = AsyncComponent(
         name=cfg.name,
-        rules=list(cfg.rules),
+        rules=cfg.rules,
         state_machine=StateMachine.from_name(cfg.initial_state),
         logger=logger,
     )
@@ -88,7 +88,7 @@ async def cmd_update_rules(args) -> None:
 
     component = AsyncComponent(
         name=cfg.name,
-        rules=list(cfg.rules),
+        rules=cfg.rules,
         state_machine=StateMachine.from_name(cfg.initial_state),
         logger=logger,
     )
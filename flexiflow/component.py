@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from .event_manager import AsyncEventManager
 from .state_machine import StateMachine
@@ -10,24 +10,56 @@ from .state_machine import StateMachine
 @dataclass
 class AsyncComponent:
     name: str
-    rules: List[dict] = field(default_factory=list)
+    # Shared as passed in; copied to a private list on first mutation
+    rules: Sequence[dict] = field(default_factory=list)
     state_machine: StateMachine = field(default_factory=lambda: StateMachine.from_name("InitialState"))
     logger: Any = None  # logging.Logger-like
     event_bus: Optional[AsyncEventManager] = None
+    # Cached class name of current_state, refreshed when the state object changes
+    _named_state: Any = field(default=None, init=False, repr=False, compare=False)
+    _state_name: str = field(default="", init=False, repr=False, compare=False)
+    _owns_rules: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def current_state_name(self) -> str:
+        """Class name of the current state."""
+        state = self.state_machine.current_state
+        if state is not self._named_state:
+            self._named_state = state
+            self._state_name = type(state).__name__
+        return self._state_name
+
+    def _mutable_rules(self) -> List[dict]:
+        if not self._owns_rules:
+            self.rules = list(self.rules)
+            self._owns_rules = True
+        return self.rules  # type: ignore[return-value]
 
     async def add_rule(self, rule: dict) -> None:
-        self.rules.append(rule)
+        self._mutable_rules().append(rule)
+        await self._emit_rules_updated()
 
     async def update_rules(self, new_rules: List[dict]) -> None:
-        self.rules.extend(new_rules)
+        self._mutable_rules().extend(new_rules)
+        await self._emit_rules_updated()
+
+    async def _emit_rules_updated(self) -> None:
+        if self.event_bus and self.event_bus.has_subscribers("component.rules.updated"):
+            await self.event_bus.publish_sequential(
+                "component.rules.updated",
+                {"component": self.name, "rules_count": len(self.rules)},
+            )
 
     async def handle_message(self, message: Dict[str, Any]) -> None:
         # Capture state before handling for observability
-        from_state = self.state_machine.current_state.__class__.__name__
+        from_state = self.current_state_name
 
-        # Emit message received event (fire-and-forget, never blocks core logic)
-        if self.event_bus:
-            await self.event_bus.publish(
+        bus = self.event_bus
+
+        # Emit message received event (fire-and-forget, never blocks core logic).
+        # Payloads are only built when someone is listening.
+        if bus and bus.has_subscribers("component.message.received"):
+            await bus.publish_sequential(
                 "component.message.received",
                 {"component": self.name, "message": message},
             )
@@ -35,7 +67,7 @@ class AsyncComponent:
         proceeded = await self.state_machine.handle_message(message, self)
 
         if proceeded:
-            to_state = self.state_machine.current_state.__class__.__name__
+            to_state = self.current_state_name
 
             if self.logger:
                 self.logger.info(
@@ -45,8 +77,42 @@ class AsyncComponent:
                 )
 
             # Emit state changed event with from/to states
-            if self.event_bus:
-                await self.event_bus.publish(
+            if bus and bus.has_subscribers("state.changed"):
+                await bus.publish_sequential(
                     "state.changed",
                     {"component": self.name, "from_state": from_state, "to_state": to_state},
                 )
+
+    async def handle_many(self, messages: Iterable[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Handle messages in order and publish their transitions as one event.
+
+        Instead of one ``state.changed`` per transition, a single
+        ``state.changed.batch`` is published once all messages are handled.
+        Returns the transitions as ``{from_state, to_state}`` dicts.
+        """
+        bus = self.event_bus
+        notify_received = bool(bus and bus.has_subscribers("component.message.received"))
+        transitions: List[Dict[str, str]] = []
+
+        for message in messages:
+            from_state = self.current_state_name
+
+            if notify_received:
+                await bus.publish_sequential(  # type: ignore[union-attr]
+                    "component.message.received",
+                    {"component": self.name, "message": message},
+                )
+
+            if await self.state_machine.handle_message(message, self):
+                to_state = self.current_state_name
+                if self.logger:
+                    self.logger.info("%s transitioned to %s", self.name, to_state)
+                transitions.append({"from_state": from_state, "to_state": to_state})
+
+        if transitions and bus and bus.has_subscribers("state.changed.batch"):
+            await bus.publish_sequential(
+                "state.changed.batch",
+                {"component": self.name, "transitions": transitions},
+            )
+
+        return transitions
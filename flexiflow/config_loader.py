@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import copy
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from .errors import (
     ConfigError,
     ErrorContext,
@@ -24,12 +24,36 @@ class ComponentConfig:
     initial_state: str = "InitialState"
 
 
+@functools.lru_cache(maxsize=None)
+def _safe_loader() -> Any:
+    """libyaml-backed SafeLoader when PyYAML was built with it.
+
+    PyYAML is imported on first use so importing flexiflow stays cheap for
+    callers that never parse YAML.
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader  # type: ignore[assignment]
+    return loader
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file. Cached per (path, mtime, size); edits miss the cache."""
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_safe_loader()) or {}
+
+
 class ConfigLoader:
     @staticmethod
     def load_yaml(path: str | Path) -> Dict[str, Any]:
         p = Path(path)
-        with p.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        st = p.stat()
+        # Callers get their own copy so the cached parse is never mutated
+        data = copy.deepcopy(_parse_yaml_file(str(p), st.st_mtime_ns, st.st_size))
         if not isinstance(data, dict):
             raise config_wrong_type(
                 field="(root)",
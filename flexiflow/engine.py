@@ -26,14 +26,13 @@ class FlexiFlowEngine:
         self.components[component.name] = component
         self.logger.info("Registered component: %s", component.name)
 
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
+        # _get_running_loop() returns None instead of raising outside a loop,
+        # which is the common sync CLI case. The publish is always scheduled:
+        # handlers may subscribe after register() but before the task runs.
+        loop = asyncio._get_running_loop()
         if loop is not None:
             loop.create_task(
-                self.event_bus.publish(
+                self.event_bus.publish_sequential(
                     "engine.component.registered",
                     {"component": component.name},
                 )
@@ -41,7 +40,7 @@ class FlexiFlowEngine:
 
     async def register_async(self, component: Any) -> None:
         self.register(component)
-        await self.event_bus.publish(
+        await self.event_bus.publish_sequential(
             "engine.component.registered",
             {"component": component.name},
         )
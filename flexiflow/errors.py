@@ -14,9 +14,13 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorContext:
-    """Structured context for error messages."""
+    """Structured context for error messages.
+
+    Values are stored as-is and only repr()'d by format(), which
+    FlexiFlowError calls the first time the error is rendered.
+    """
 
     items: Dict[str, Any] = field(default_factory=dict)
 
@@ -55,10 +59,23 @@ class FlexiFlowError(Exception):
         self.why = why
         self.fix = fix
         self.context = context or ErrorContext()
+        self._cached_msg: Optional[str] = None
+
+        # The full message is built on first str(); errors that are caught
+        # and discarded never pay for formatting the context.
+        super().__init__(what)
 
-        # Build the full message
-        message = self._format_message()
-        super().__init__(message)
+    def __str__(self) -> str:
+        if self._cached_msg is None:
+            self._cached_msg = self._format_message()
+        return self._cached_msg
+
+    def __reduce__(self):
+        # args holds only `what`; the structured fields travel in the state
+        # dict, without the rendered message (rebuilt on demand).
+        state = dict(self.__dict__)
+        state["_cached_msg"] = None
+        return (type(self), self.args, state)
 
     def _format_message(self) -> str:
         """Format the full error message."""
@@ -106,10 +123,9 @@ class ImportError_(FlexiFlowError):
 
 def config_missing_field(field: str, path: Optional[str] = None) -> ConfigError:
     """Config is missing a required field."""
-    ctx = ErrorContext()
-    if path:
-        ctx.add("config_path", path)
-    ctx.add("field", field)
+    items: Dict[str, Any] = {"config_path": path} if path else {}
+    items["field"] = field
+    ctx = ErrorContext(items=items)
 
     return ConfigError(
         f"Config missing required field: '{field}'",
@@ -123,12 +139,11 @@ def config_wrong_type(
     field: str, expected: str, got: str, path: Optional[str] = None
 ) -> ConfigError:
     """Config field has wrong type."""
-    ctx = ErrorContext()
-    if path:
-        ctx.add("config_path", path)
-    ctx.add("field", field)
-    ctx.add("expected", expected)
-    ctx.add("got", got)
+    items: Dict[str, Any] = {"config_path": path} if path else {}
+    items["field"] = field
+    items["expected"] = expected
+    items["got"] = got
+    ctx = ErrorContext(items=items)
 
     return ConfigError(
         f"Config field '{field}' has wrong type",
@@ -140,17 +155,16 @@ def config_wrong_type(
 
 def state_not_found(name: str, valid_states: list) -> StateError:
     """State name not found in registry."""
-    # Show up to 5 valid states to avoid overwhelming output
-    shown = valid_states[:5]
-    more = len(valid_states) - 5 if len(valid_states) > 5 else 0
+    # Show up to 5 valid states to avoid overwhelming output. Always a copy:
+    # the context is rendered lazily and must not follow the caller's list.
+    shown = list(valid_states[:5])
+    more = len(valid_states) - len(shown)
 
     valid_str = ", ".join(shown)
     if more > 0:
         valid_str += f" (+{more} more)"
 
-    ctx = ErrorContext()
-    ctx.add("requested_state", name)
-    ctx.add("valid_states", shown)
+    ctx = ErrorContext(items={"requested_state": name, "valid_states": shown})
 
     return StateError(
         f"Unknown state: '{name}'",
@@ -163,9 +177,7 @@ def state_not_found(name: str, valid_states: list) -> StateError:
 
 def persistence_invalid_json(path: str, error: str) -> PersistenceError:
     """Persistence file contains invalid JSON."""
-    ctx = ErrorContext()
-    ctx.add("path", path)
-    ctx.add("error", error)
+    ctx = ErrorContext(items={"path": path, "error": error})
 
     return PersistenceError(
         f"Invalid JSON in state file: {path}",
@@ -177,9 +189,7 @@ def persistence_invalid_json(path: str, error: str) -> PersistenceError:
 
 def persistence_missing_field(path: str, field: str) -> PersistenceError:
     """Persistence file is missing a required field."""
-    ctx = ErrorContext()
-    ctx.add("path", path)
-    ctx.add("field", field)
+    ctx = ErrorContext(items={"path": path, "field": field})
 
     return PersistenceError(
         f"State file missing required field: '{field}'",
@@ -192,8 +202,7 @@ def persistence_missing_field(path: str, field: str) -> PersistenceError:
 
 def import_invalid_format(dotted_path: str) -> ImportError_:
     """Dotted path has invalid format."""
-    ctx = ErrorContext()
-    ctx.add("dotted_path", dotted_path)
+    ctx = ErrorContext(items={"dotted_path": dotted_path})
 
     return ImportError_(
         f"Invalid dotted path format: '{dotted_path}'",
@@ -205,9 +214,7 @@ def import_invalid_format(dotted_path: str) -> ImportError_:
 
 def import_module_not_found(module: str, dotted_path: str) -> ImportError_:
     """Module in dotted path not found."""
-    ctx = ErrorContext()
-    ctx.add("module", module)
-    ctx.add("dotted_path", dotted_path)
+    ctx = ErrorContext(items={"module": module, "dotted_path": dotted_path})
 
     return ImportError_(
         f"Module not found: '{module}'",
@@ -220,10 +227,9 @@ def import_module_not_found(module: str, dotted_path: str) -> ImportError_:
 
 def import_symbol_not_found(module: str, symbol: str, dotted_path: str) -> ImportError_:
     """Symbol not found in module."""
-    ctx = ErrorContext()
-    ctx.add("module", module)
-    ctx.add("symbol", symbol)
-    ctx.add("dotted_path", dotted_path)
+    ctx = ErrorContext(
+        items={"module": module, "symbol": symbol, "dotted_path": dotted_path}
+    )
 
     return ImportError_(
         f"Symbol '{symbol}' not found in module '{module}'",
@@ -236,9 +242,7 @@ def import_symbol_not_found(module: str, symbol: str, dotted_path: str) -> Impor
 
 def import_not_state_subclass(dotted_path: str, got_type: str) -> ImportError_:
     """Imported symbol is not a State subclass."""
-    ctx = ErrorContext()
-    ctx.add("dotted_path", dotted_path)
-    ctx.add("got_type", got_type)
+    ctx = ErrorContext(items={"dotted_path": dotted_path, "got_type": got_type})
 
     return ImportError_(
         f"Not a State subclass: '{dotted_path}'",
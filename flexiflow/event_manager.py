@@ -1,39 +1,69 @@
 from __future__ import annotations
 
 import asyncio
-import uuid
-from collections import defaultdict
+import itertools
+import logging
+import sys
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, DefaultDict, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 Handler = Callable[[Any], Awaitable[None]]
 FilterFn = Callable[[str, Any], bool]
 
+# Valid subscription priorities, lowest number delivered first
+MIN_PRIORITY = 1
+MAX_PRIORITY = 5
 
-@dataclass(frozen=True)
+# Accepted publish() modes
+DELIVERY_MODES = frozenset({"sequential", "concurrent"})
+ERROR_POLICIES = frozenset({"continue", "raise"})
+
+# Process-wide so a handle from one manager never matches another's subscription
+_next_subscription_id = itertools.count(1).__next__
+
+
+@dataclass(frozen=True, slots=True)
 class SubscriptionHandle:
     """Opaque handle returned by subscribe(), used for unsubscribe()."""
     event_name: str
-    subscription_id: str  # uuid string
+    subscription_id: int
+    # Priority bucket to search on unsubscribe; None searches every bucket
+    priority: Optional[int] = None
+    # Owning component for the reverse index; None falls back to a scan
+    component_name: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Subscription:
-    subscription_id: str
+    subscription_id: int
     priority: int
     component_name: str
     handler: Handler
     filter_fn: Optional[FilterFn] = None
 
 
+def _new_buckets() -> List[Dict[int, Subscription]]:
+    """One id -> subscription dict per priority, in delivery order."""
+    return [{} for _ in range(MIN_PRIORITY, MAX_PRIORITY + 1)]
+
+
 class AsyncEventManager:
     """Async pub/sub bus with priorities, optional filters, and sequential/concurrent delivery."""
 
     def __init__(self, logger: Any = None) -> None:
-        self._events: DefaultDict[str, List[Subscription]] = defaultdict(list)
+        # Subscriptions per event, bucketed by priority so publish never sorts.
+        # Buckets are keyed by subscription id (dicts keep insertion order).
+        self._events: Dict[str, List[Dict[int, Subscription]]] = {}
+        # Number of subscriptions with a filter_fn per event; publish skips
+        # filter checks for events where this is zero
+        self._filtered_count: Dict[str, int] = {}
+        # Delivery-ordered tuple per event, rebuilt on every subscribe and
+        # unsubscribe so publish only reads it. A change during delivery swaps
+        # in a new tuple rather than mutating the one being iterated.
+        self._views: Dict[str, Tuple[Subscription, ...]] = {}
         self._logger = logger
         # Reverse index to speed up component-wide unsubscribe
-        self._by_component: Dict[str, List[SubscriptionHandle]] = defaultdict(list)
+        self._by_component: Dict[str, Dict[int, SubscriptionHandle]] = {}
 
     async def subscribe(
         self,
@@ -48,10 +78,14 @@ class AsyncEventManager:
 
         Returns a SubscriptionHandle that can be passed to unsubscribe().
         """
-        if not (1 <= priority <= 5):
+        if not (MIN_PRIORITY <= priority <= MAX_PRIORITY):
             raise ValueError("priority must be an integer between 1 and 5")
 
-        subscription_id = str(uuid.uuid4())
+        # Stored names are long-lived dict keys; share one object per name
+        event_name = sys.intern(event_name)
+        component_name = sys.intern(component_name)
+
+        subscription_id = _next_subscription_id()
         sub = Subscription(
             subscription_id=subscription_id,
             priority=priority,
@@ -59,10 +93,24 @@ class AsyncEventManager:
             handler=handler,
             filter_fn=filter_fn,
         )
-        self._events[event_name].append(sub)
+        buckets = self._events.get(event_name)
+        if buckets is None:
+            buckets = self._events[event_name] = _new_buckets()
+        buckets[priority - MIN_PRIORITY][subscription_id] = sub
+        self._rebuild_view(event_name, buckets)
+        if filter_fn is not None:
+            self._filtered_count[event_name] = self._filtered_count.get(event_name, 0) + 1
 
-        handle = SubscriptionHandle(event_name=event_name, subscription_id=subscription_id)
-        self._by_component[component_name].append(handle)
+        handle = SubscriptionHandle(
+            event_name=event_name,
+            subscription_id=subscription_id,
+            priority=priority,
+            component_name=component_name,
+        )
+        handles = self._by_component.get(component_name)
+        if handles is None:
+            handles = self._by_component[component_name] = {}
+        handles[subscription_id] = handle
         return handle
 
     def unsubscribe(self, handle: SubscriptionHandle) -> bool:
@@ -72,26 +120,49 @@ class AsyncEventManager:
         Returns True if something was removed, False otherwise.
         Safe to call multiple times (idempotent).
         """
-        subs = self._events.get(handle.event_name)
-        if not subs:
+        buckets = self._events.get(handle.event_name)
+        if not buckets:
+            return False
+
+        sid = handle.subscription_id
+        sub: Optional[Subscription] = None
+        if handle.priority is None:
+            for bucket in buckets:
+                sub = bucket.pop(sid, None)
+                if sub is not None:
+                    break
+        elif MIN_PRIORITY <= handle.priority <= MAX_PRIORITY:
+            sub = buckets[handle.priority - MIN_PRIORITY].pop(sid, None)
+        else:
             return False
+        removed = sub is not None
+        if removed:
+            self._rebuild_view(handle.event_name, buckets)
 
-        before = len(subs)
-        subs[:] = [s for s in subs if s.subscription_id != handle.subscription_id]
-        removed = len(subs) != before
+        if sub is not None and sub.filter_fn is not None:
+            remaining = self._filtered_count[handle.event_name] - 1
+            if remaining:
+                self._filtered_count[handle.event_name] = remaining
+            else:
+                del self._filtered_count[handle.event_name]
 
         # Clean up reverse index
         if removed:
-            for comp, handles in list(self._by_component.items()):
-                new_list = [h for h in handles if h != handle]
-                if len(new_list) != len(handles):
-                    self._by_component[comp] = new_list
-                    if not new_list:
-                        self._by_component.pop(comp, None)
-                    break
+            owner = handle.component_name
+            if owner is None:
+                # Bare handle: find the owner without copying the index
+                owner = next(
+                    (comp for comp, handles in self._by_component.items() if sid in handles),
+                    None,
+                )
+            handles = self._by_component.get(owner) if owner is not None else None
+            if handles is not None:
+                handles.pop(sid, None)
+                if not handles:
+                    del self._by_component[owner]
 
         # Clean up empty event lists
-        if not subs:
+        if not any(buckets):
             self._events.pop(handle.event_name, None)
 
         return removed
@@ -102,13 +173,25 @@ class AsyncEventManager:
 
         Returns the number of subscriptions removed.
         """
-        handles = self._by_component.pop(component_name, [])
+        handles = self._by_component.pop(component_name, {})
         count = 0
-        for h in handles:
+        for h in handles.values():
             if self.unsubscribe(h):
                 count += 1
         return count
 
+    def has_subscribers(self, event_name: str) -> bool:
+        """Return True if at least one handler is subscribed to event_name."""
+        return event_name in self._views
+
+    def _rebuild_view(self, event_name: str, buckets: List[Dict[int, Subscription]]) -> None:
+        # Buckets are already in priority order; stable within a priority
+        view = tuple(s for bucket in buckets for s in bucket.values())
+        if view:
+            self._views[event_name] = view
+        else:
+            self._views.pop(event_name, None)
+
     async def publish(
         self,
         event_name: str,
@@ -125,50 +208,130 @@ class AsyncEventManager:
             data: Optional data payload
             delivery: "sequential" (default) or "concurrent"
             on_error: "continue" (default, log and proceed) or "raise" (propagate first exception)
+
+        With delivery="concurrent" and on_error="raise", the first failure is
+        raised as soon as it happens; the other handlers are not cancelled
+        and may still be running after publish() raises.
         """
-        if delivery not in ("sequential", "concurrent"):
+        if delivery not in DELIVERY_MODES:
             raise ValueError("delivery must be 'sequential' or 'concurrent'")
-        if on_error not in ("continue", "raise"):
+        if on_error not in ERROR_POLICIES:
             raise ValueError("on_error must be 'continue' or 'raise'")
 
-        subs = self._events.get(event_name, [])
-        if not subs:
+        if delivery == "concurrent":
+            await self.publish_concurrent(event_name, data, raise_on_error=on_error == "raise")
+        else:
+            await self.publish_sequential(event_name, data, raise_on_error=on_error == "raise")
+
+    async def publish_sequential(
+        self, event_name: str, data: Any = None, *, raise_on_error: bool = False
+    ) -> None:
+        """
+        Publish an event, awaiting each handler in priority order.
+
+        Same as publish(delivery="sequential") without per-call mode validation.
+
+        Args:
+            event_name: The event to publish
+            data: Optional data payload
+            raise_on_error: Propagate the first handler exception instead of
+                logging it and continuing
+        """
+        ordered = self._eligible(event_name, data)
+        if not ordered:
             return
+        if raise_on_error:
+            await self._deliver_until_error(event_name, ordered, data)
+        else:
+            await self._deliver_all(event_name, ordered, data)
 
-        eligible = [s for s in subs if s.filter_fn is None or s.filter_fn(event_name, data)]
-        ordered = sorted(eligible, key=lambda s: s.priority)
+    async def publish_concurrent(
+        self, event_name: str, data: Any = None, *, raise_on_error: bool = False
+    ) -> None:
+        """
+        Publish an event, running all handlers concurrently.
 
-        if delivery == "concurrent":
-            tasks = [asyncio.create_task(s.handler(data)) for s in ordered]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            if on_error == "raise":
-                for r in results:
-                    if isinstance(r, Exception):
-                        raise r
-
-            # Log and emit failure events for exceptions (continue mode)
-            for s, r in zip(ordered, results):
-                if isinstance(r, Exception):
-                    if self._logger:
-                        self._logger.error("Error handling event %s: %s", event_name, r)
-                    # Emit handler.failed event (avoid recursion by not emitting for handler.failed itself)
-                    if event_name != "event.handler.failed":
-                        await self._emit_handler_failed(event_name, s.component_name, r)
+        Same as publish(delivery="concurrent") without per-call mode validation.
+
+        Args:
+            event_name: The event to publish
+            data: Optional data payload
+            raise_on_error: Propagate the first handler exception instead of
+                logging it and continuing. It is raised as soon as it happens;
+                the other handlers are not cancelled and may still be running
+                after this call raises.
+        """
+        ordered = self._eligible(event_name, data)
+        if not ordered:
             return
+        # Even a lone handler goes through gather: it runs in its own Task and
+        # contextvars context, and errors are handled the same for any count
+        if raise_on_error:
+            await self._gather_until_error(ordered, data)
+        else:
+            await self._gather_all(event_name, ordered, data)
+
+    def _eligible(self, event_name: str, data: Any) -> Sequence[Subscription]:
+        """Subscriptions to deliver to, in order, after applying filters."""
+        ordered: Sequence[Subscription] = self._views.get(event_name, ())
+        if ordered and event_name in self._filtered_count:
+            ordered = [s for s in ordered if s.filter_fn is None or s.filter_fn(event_name, data)]
+        return ordered
+
+    async def _gather_until_error(self, subs: Sequence[Subscription], data: Any) -> None:
+        """Run handlers concurrently; raise the first failure as soon as it happens."""
+        # The remaining handlers keep running to completion
+        await asyncio.gather(*(s.handler(data) for s in subs))
+
+    async def _gather_all(
+        self, event_name: str, subs: Sequence[Subscription], data: Any
+    ) -> None:
+        """Run handlers concurrently; log and report every failure."""
+        results = await asyncio.gather(*(s.handler(data) for s in subs), return_exceptions=True)
+
+        log_errors = self._logs_errors()
+        for s, r in zip(subs, results):
+            if isinstance(r, Exception):
+                if log_errors:
+                    self._logger.error("Error handling event %s: %s", event_name, r)
+                # Emit handler.failed event (avoid recursion by not emitting for handler.failed itself)
+                if event_name != "event.handler.failed":
+                    await self._emit_handler_failed(event_name, s.component_name, r)
 
-        # sequential delivery
-        for s in ordered:
+    async def _deliver_until_error(
+        self, event_name: str, subs: Sequence[Subscription], data: Any
+    ) -> None:
+        """Run handlers in order; log and re-raise the first exception."""
+        for s in subs:
             try:
                 await s.handler(data)
             except Exception as e:
-                if self._logger:
+                if self._logs_errors():
                     self._logger.error("Error handling event %s: %s", event_name, e)
-                # Emit handler.failed event (avoid recursion by not emitting for handler.failed itself)
-                if on_error == "continue" and event_name != "event.handler.failed":
+                raise
+
+    async def _deliver_all(
+        self, event_name: str, subs: Sequence[Subscription], data: Any
+    ) -> None:
+        """Run every handler in order; log and report failures, then continue."""
+        # Emit handler.failed event (avoid recursion by not emitting for handler.failed itself)
+        emit_failures = event_name != "event.handler.failed"
+        for s in subs:
+            try:
+                await s.handler(data)
+            except Exception as e:
+                if self._logs_errors():
+                    self._logger.error("Error handling event %s: %s", event_name, e)
+                if emit_failures:
                     await self._emit_handler_failed(event_name, s.component_name, e)
-                if on_error == "raise":
-                    raise
+
+    def _logs_errors(self) -> bool:
+        """True if a logger is attached and would emit ERROR records."""
+        logger = self._logger
+        if not logger:
+            return False
+        is_enabled = getattr(logger, "isEnabledFor", None)
+        return is_enabled is None or is_enabled(logging.ERROR)
 
     async def _emit_handler_failed(
         self,
@@ -178,7 +341,7 @@ class AsyncEventManager:
     ) -> None:
         """Emit event.handler.failed observability event. Fire-and-forget, never raises."""
         try:
-            await self.publish(
+            await self.publish_sequential(
                 "event.handler.failed",
                 {
                     "event_name": event_name,
@@ -6,20 +6,25 @@ and will it work?" — without executing or mutating anything.
 
 from __future__ import annotations
 
-import importlib
+import sys
 from dataclasses import dataclass, field
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import yaml
-
+from .config_loader import _parse_yaml_file
 from .errors import ErrorContext, FlexiFlowError
+from .imports import _MISSING, _cache_symbol, _cached_symbol, _import_module
 from .pack_loader import collect_provided_keys, load_packs
 from .state_machine import DEFAULT_REGISTRY, State
 from .statepack import StatePack, TransitionSpec
 
+# Header prefixes for the two levels explain() emits
+_LEVEL_PREFIX = {"error": "[ERROR] ", "warning": "[WARNING] "}
+
 
-@dataclass
+@dataclass(slots=True)
 class Diagnostic:
     """A single warning or error from config explanation."""
 
@@ -31,18 +36,19 @@ class Diagnostic:
 
     def format(self) -> str:
         """Format as structured message (matches FlexiFlowError format)."""
-        lines = [f"[{self.level.upper()}] {self.what}"]
-        if self.why:
-            lines.append(f"Why: {self.why}")
-        if self.fix:
-            lines.append(f"Fix: {self.fix}")
-        if self.context:
-            ctx_lines = [f"  {k}={v!r}" for k, v in self.context.items()]
-            lines.append("Context:\n" + "\n".join(ctx_lines))
-        return "\n".join(lines)
+        prefix = _LEVEL_PREFIX.get(self.level) or f"[{self.level.upper()}] "
+        parts = (
+            f"{prefix}{self.what}",
+            f"Why: {self.why}" if self.why else None,
+            f"Fix: {self.fix}" if self.fix else None,
+            "Context:\n" + "\n".join(f"  {k}={v!r}" for k, v in self.context.items())
+            if self.context
+            else None,
+        )
+        return "\n".join(filter(None, parts))
 
 
-@dataclass
+@dataclass(slots=True)
 class StateResolution:
     """Resolution details for a single state."""
 
@@ -53,7 +59,7 @@ class StateResolution:
     error: Optional[str] = None  # Error message if failed
 
 
-@dataclass
+@dataclass(slots=True)
 class PackInfo:
     """Information about a single StatePack."""
 
@@ -63,7 +69,7 @@ class PackInfo:
     depends_on: List[str]  # Sorted list of pack dependencies
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigExplanation:
     """Structured explanation of a FlexiFlow config."""
 
@@ -107,75 +113,51 @@ class ConfigExplanation:
             "=" * 40,
             f"Source: {self.config_path}",
             "",
+            # Component info
+            "Component:",
+            f"  name: {self.name or '(missing)'}",
+            f"  initial_state: {self.initial_state or '(missing)'}",
+            f"  rules: {self.rules_count} rule(s)",
+            "",
         ]
 
-        # Component info
-        lines.append("Component:")
-        lines.append(f"  name: {self.name or '(missing)'}")
-        lines.append(f"  initial_state: {self.initial_state or '(missing)'}")
-        lines.append(f"  rules: {self.rules_count} rule(s)")
-        lines.append("")
-
         # Packs (v0.4.0+)
         if self.packs:
             lines.append("Packs:")
-            for pack in self.packs:
-                keys_str = ", ".join(pack.provided_keys) if pack.provided_keys else "(none)"
-                lines.append(f"  {pack.name}:")
-                lines.append(f"    provides: {keys_str}")
-                if pack.transitions:
-                    lines.append(f"    transitions: {len(pack.transitions)} defined")
-                if pack.depends_on:
-                    lines.append(f"    depends_on: {', '.join(pack.depends_on)}")
+            lines.extend(_format_pack(pack) for pack in self.packs)
             lines.append("")
 
             # Pack order (evaluation order for state lookup)
             if self.pack_order:
-                lines.append(f"Pack order: {' → '.join(self.pack_order)}")
-                lines.append("")
-
-        # Resolution policy
-        policy_str = " → ".join(self.initial_state_resolution)
-        lines.append(f"Resolution policy: {policy_str}")
-        lines.append("")
+                lines.extend((f"Pack order: {' → '.join(self.pack_order)}", ""))
 
-        # States (sorted for deterministic output) - legacy section
-        lines.append("States:")
+        # Resolution policy, then states (sorted for deterministic output)
+        lines.extend(
+            (f"Resolution policy: {' → '.join(self.initial_state_resolution)}", "", "States:")
+        )
         if self.states:
-            for s in sorted(self.states, key=lambda x: x.key):
-                status = "✓" if s.resolved and s.is_state_subclass else "✗"
-                # Include provider info if available
-                provider = self.state_providers.get(s.key)
-                provider_suffix = f" (from {provider})" if provider else ""
-                if s.dotted_path:
-                    lines.append(f"  {status} {s.key}: {s.dotted_path}{provider_suffix}")
-                else:
-                    lines.append(f"  {status} {s.key}{provider_suffix}")
-                if s.error:
-                    lines.append(f"      Error: {s.error}")
+            providers = self.state_providers
+            lines.extend(
+                _format_state(s, providers.get(s.key))
+                for s in sorted(self.states, key=attrgetter("key"))
+            )
         else:
             lines.append("  (no custom states)")
 
-        lines.append(f"  Built-in: {', '.join(sorted(self.builtin_states))}")
-        lines.append("")
+        lines.extend((f"  Built-in: {', '.join(sorted(self.builtin_states))}", ""))
 
         # Diagnostics
         if self.warnings:
             lines.append("Warnings:")
-            for w in self.warnings:
-                lines.append(f"  ⚠ {w.what}")
-                if w.fix:
-                    lines.append(f"    Fix: {w.fix}")
+            lines.extend(
+                f"  ⚠ {w.what}\n    Fix: {w.fix}" if w.fix else f"  ⚠ {w.what}"
+                for w in self.warnings
+            )
             lines.append("")
 
         if self.errors:
             lines.append("Errors:")
-            for e in self.errors:
-                lines.append(f"  ✗ {e.what}")
-                if e.why:
-                    lines.append(f"    Why: {e.why}")
-                if e.fix:
-                    lines.append(f"    Fix: {e.fix}")
+            lines.extend(_format_error(e) for e in self.errors)
             lines.append("")
 
         # Summary
@@ -187,12 +169,85 @@ class ConfigExplanation:
         return "\n".join(lines)
 
 
+def _format_pack(pack: PackInfo) -> str:
+    """Format one pack entry (2-4 lines) for ConfigExplanation.format."""
+    keys_str = ", ".join(pack.provided_keys) if pack.provided_keys else "(none)"
+    text = f"  {pack.name}:\n    provides: {keys_str}"
+    if pack.transitions:
+        text += f"\n    transitions: {len(pack.transitions)} defined"
+    if pack.depends_on:
+        text += f"\n    depends_on: {', '.join(pack.depends_on)}"
+    return text
+
+
+def _format_state(s: StateResolution, provider: Optional[str]) -> str:
+    """Format one state entry (plus its error line, if any)."""
+    status = "✓" if s.resolved and s.is_state_subclass else "✗"
+    # Include provider info if available
+    provider_suffix = f" (from {provider})" if provider else ""
+    if s.dotted_path:
+        text = f"  {status} {s.key}: {s.dotted_path}{provider_suffix}"
+    else:
+        text = f"  {status} {s.key}{provider_suffix}"
+    if s.error:
+        text += f"\n      Error: {s.error}"
+    return text
+
+
+def _format_error(e: Diagnostic) -> str:
+    """Format one entry of the Errors section."""
+    text = f"  ✗ {e.what}"
+    if e.why:
+        text += f"\n    Why: {e.why}"
+    if e.fix:
+        text += f"\n    Fix: {e.fix}"
+    return text
+
+
+def _add_error(
+    result: ConfigExplanation,
+    what: str,
+    why: Optional[str] = None,
+    fix: Optional[str] = None,
+    **context: Any,
+) -> None:
+    """Append an error Diagnostic whose context starts with the config path."""
+    result.errors.append(
+        Diagnostic(
+            level="error",
+            what=what,
+            why=why,
+            fix=fix,
+            context={"path": result.config_path, **context},
+        )
+    )
+
+
+def _diag_from_error(e: FlexiFlowError, prefix: str = "") -> Diagnostic:
+    """Convert a FlexiFlowError into an error Diagnostic.
+
+    Every FlexiFlowError carries what/why/fix and an ErrorContext, so the
+    fields are read directly rather than probed.
+    """
+    return Diagnostic(
+        level="error",
+        what=f"{prefix}{e.what}",
+        why=e.why,
+        fix=e.fix,
+        context=e.context.items,
+    )
+
+
 def _try_import_symbol(dotted: str) -> tuple[Any, Optional[str]]:
     """Try to import a symbol, returning (symbol, error_msg)."""
-    if ":" not in dotted:
+    symbol = _cached_symbol(dotted)
+    if symbol is not _MISSING:
+        return symbol, None
+
+    module_path, sep, symbol_name = dotted.partition(":")
+    if not sep:
         return None, f"Invalid format: missing ':' separator"
 
-    module_path, symbol_name = dotted.split(":", 1)
     module_path = module_path.strip()
     symbol_name = symbol_name.strip()
 
@@ -200,28 +255,37 @@ def _try_import_symbol(dotted: str) -> tuple[Any, Optional[str]]:
         return None, f"Invalid format: empty module or symbol"
 
     try:
-        module = importlib.import_module(module_path)
-    except Exception as e:
+        module = _import_module(module_path)
+    except Exception:
         return None, f"Module not found: {module_path}"
 
     try:
-        return getattr(module, symbol_name), None
+        symbol = getattr(module, symbol_name)
     except AttributeError:
         return None, f"Symbol '{symbol_name}' not found in '{module_path}'"
 
+    _cache_symbol(dotted, module_path, symbol_name, module, symbol)
+    return symbol, None
+
+
+def _intern(value: Any) -> Any:
+    """sys.intern() for exact str; anything else (str subclasses too) as is."""
+    return sys.intern(value) if type(value) is str else value
+
 
 def _populate_pack_info(
     result: ConfigExplanation,
     data: Dict[str, Any],
     states_mapping: Optional[Dict[str, str]],
+    resolved_states: Dict[str, type],
 ) -> None:
     """Populate pack-related fields in the explanation.
 
     Uses load_packs internally to get the normalized pack list,
     then extracts info for display without any side effects.
+    resolved_states maps state keys to the classes already resolved
+    from states_mapping.
     """
-    from .errors import ConfigError, FlexiFlowError
-
     # Check if config uses states or packs
     has_states = states_mapping is not None and len(states_mapping) > 0
     has_packs = "packs" in data and data["packs"] is not None
@@ -233,14 +297,6 @@ def _populate_pack_info(
     # Try to load packs (catches errors gracefully)
     try:
         if has_states:
-            # Build a dict mapping keys to classes (for valid states only)
-            resolved_states = {}
-            for s in result.states:
-                if s.resolved and s.is_state_subclass and s.dotted_path:
-                    symbol, _ = _try_import_symbol(s.dotted_path)
-                    if symbol:
-                        resolved_states[s.key] = symbol
-
             if resolved_states:
                 loaded_packs = load_packs(states=resolved_states)
             else:
@@ -249,30 +305,17 @@ def _populate_pack_info(
             # packs: list - try to load them
             packs_list = data.get("packs", [])
             if not isinstance(packs_list, list):
-                result.errors.append(
-                    Diagnostic(
-                        level="error",
-                        what="Field 'packs' must be a list",
-                        why=f"Got {type(packs_list).__name__}.",
-                        fix="Use format: packs:\n  - 'module:PackClass'",
-                        context={"path": result.config_path},
-                    )
+                _add_error(
+                    result,
+                    "Field 'packs' must be a list",
+                    why=f"Got {type(packs_list).__name__}.",
+                    fix="Use format: packs:\n  - 'module:PackClass'",
                 )
                 return
             loaded_packs = load_packs(packs=packs_list)
-    except (ConfigError, FlexiFlowError) as e:
-        # Pack loading failed - add as diagnostic
-        ctx = getattr(e, "context", None)
-        ctx_dict = ctx.items if ctx and hasattr(ctx, "items") else {}
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what=f"Pack loading failed: {e.what if hasattr(e, 'what') else str(e)}",
-                why=getattr(e, "why", None),
-                fix=getattr(e, "fix", None),
-                context=ctx_dict,
-            )
-        )
+    except FlexiFlowError as e:
+        # Pack loading failed (ConfigError and friends) - add as diagnostic
+        result.errors.append(_diag_from_error(e, "Pack loading failed: "))
         return
     except Exception as e:
         # Unexpected error
@@ -285,29 +328,38 @@ def _populate_pack_info(
         )
         return
 
-    # Populate pack info
-    for pack in loaded_packs:
-        provided = pack.provides()
+    # Populate pack info; provides() results are reused for state_providers
+    provided_by_pack = [pack.provides() for pack in loaded_packs]
+    for pack, provided in zip(loaded_packs, provided_by_pack):
         transitions = pack.transitions()
         depends = pack.depends_on()
 
         pack_info = PackInfo(
             name=pack.name,
-            provided_keys=sorted(provided.keys()),
+            provided_keys=sorted(provided),
             transitions=transitions,
             depends_on=sorted(depends),
         )
         result.packs.append(pack_info)
 
-    # Build state_providers mapping
-    result.state_providers = collect_provided_keys(loaded_packs)
+    # Build state_providers mapping. Keys and pack names repeat across the
+    # configs a process explains, so they are interned like event names.
+    intern = _intern
+    result.state_providers = {
+        intern(key): intern(pack_name)
+        for key, pack_name in collect_provided_keys(
+            loaded_packs, provided=provided_by_pack
+        ).items()
+    }
 
     # Resolution order is pack list order (first pack wins for conflicts)
-    result.pack_order = [p.name for p in loaded_packs]
+    result.pack_order = [intern(p.name) for p in loaded_packs]
 
 
 # Valid resolution policy values
 VALID_RESOLUTION_SOURCES = {"packs", "builtin"}
+# Every accepted ordering of VALID_RESOLUTION_SOURCES
+_VALID_RESOLUTION_POLICIES = (("packs", "builtin"), ("builtin", "packs"))
 
 
 def _parse_resolution_policy(
@@ -330,47 +382,39 @@ def _parse_resolution_policy(
 
     # Validate type
     if not isinstance(policy, list):
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Field 'initial_state_resolution' must be a list",
-                why=f"Got {type(policy).__name__}.",
-                fix='Use format: initial_state_resolution: ["packs", "builtin"]',
-                context={"path": result.config_path},
-            )
+        _add_error(
+            result,
+            "Field 'initial_state_resolution' must be a list",
+            why=f"Got {type(policy).__name__}.",
+            fix='Use format: initial_state_resolution: ["packs", "builtin"]',
         )
         return
 
     # Validate contents
     if len(policy) != 2:
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Field 'initial_state_resolution' must have exactly 2 elements",
-                why=f"Got {len(policy)} elements.",
-                fix='Use: ["packs", "builtin"] or ["builtin", "packs"]',
-                context={"path": result.config_path, "policy": policy},
-            )
+        _add_error(
+            result,
+            "Field 'initial_state_resolution' must have exactly 2 elements",
+            why=f"Got {len(policy)} elements.",
+            fix='Use: ["packs", "builtin"] or ["builtin", "packs"]',
+            policy=list(policy),
         )
         return
 
     # Validate each element
-    policy_set = set(policy)
-    if policy_set != VALID_RESOLUTION_SOURCES:
-        invalid = policy_set - VALID_RESOLUTION_SOURCES
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what=f"Invalid resolution source(s): {invalid}",
-                why="Only 'packs' and 'builtin' are valid resolution sources.",
-                fix='Use: ["packs", "builtin"] or ["builtin", "packs"]',
-                context={"path": result.config_path, "policy": policy},
-            )
+    if tuple(policy) not in _VALID_RESOLUTION_POLICIES:
+        invalid = set(policy) - VALID_RESOLUTION_SOURCES
+        _add_error(
+            result,
+            f"Invalid resolution source(s): {invalid}",
+            why="Only 'packs' and 'builtin' are valid resolution sources.",
+            fix='Use: ["packs", "builtin"] or ["builtin", "packs"]',
+            policy=list(policy),
         )
         return
 
     # Valid policy - set it
-    result.initial_state_resolution = policy
+    result.initial_state_resolution = list(policy)
 
 
 def explain(config: Union[str, Path, Dict[str, Any]]) -> ConfigExplanation:
@@ -408,30 +452,28 @@ def explain(config: Union[str, Path, Dict[str, Any]]) -> ConfigExplanation:
     # Collect built-in states
     result.builtin_states = DEFAULT_REGISTRY.names()
 
-    # Try to load YAML
-    if not path.exists():
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what=f"Config file not found: {path}",
-                fix="Check the path and ensure the file exists.",
-                context={"path": result.config_path},
-            )
-        )
-        return result
+    import yaml  # deferred: only file input needs PyYAML
 
+    # Parsed data is shared with ConfigLoader's (path, mtime, size) cache, so
+    # repeat explains of an unchanged file skip the parse. It is only read
+    # here; anything kept on the result is copied. The stat doubles as the
+    # existence check.
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        st = path.stat()
+        data = _parse_yaml_file(str(path), st.st_mtime_ns, st.st_size)
+    except (FileNotFoundError, NotADirectoryError):
+        _add_error(
+            result,
+            f"Config file not found: {path}",
+            fix="Check the path and ensure the file exists.",
+        )
+        return result
     except yaml.YAMLError as e:
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Invalid YAML syntax",
-                why=str(e),
-                fix="Check the file for YAML syntax errors.",
-                context={"path": result.config_path},
-            )
+        _add_error(
+            result,
+            "Invalid YAML syntax",
+            why=str(e),
+            fix="Check the file for YAML syntax errors.",
         )
         return result
 
@@ -443,38 +485,42 @@ def _validate_config_data(
 ) -> ConfigExplanation:
     """Validate config data and populate result with diagnostics."""
     if not isinstance(data, dict):
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Config must be a YAML mapping",
-                why=f"Got {type(data).__name__} instead of mapping.",
-                fix="Ensure your config file has key: value pairs at the top level.",
-                context={"path": result.config_path, "got_type": type(data).__name__},
-            )
+        _add_error(
+            result,
+            "Config must be a YAML mapping",
+            why=f"Got {type(data).__name__} instead of mapping.",
+            fix="Ensure your config file has key: value pairs at the top level.",
+            got_type=type(data).__name__,
+        )
+        return result
+
+    # An empty file (or {}) can only ever fail on 'name'; report it once
+    # instead of running every field check against nothing.
+    if not data:
+        _add_error(
+            result,
+            "Config is empty",
+            why="The config has no fields.",
+            fix="Add 'name' and 'initial_state' fields.",
         )
         return result
 
     # Validate name
     name = data.get("name")
     if not name:
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Missing required field: 'name'",
-                why="Every component config must have a name.",
-                fix="Add 'name: your_component_name' to your config.",
-                context={"path": result.config_path},
-            )
+        _add_error(
+            result,
+            "Missing required field: 'name'",
+            why="Every component config must have a name.",
+            fix="Add 'name: your_component_name' to your config.",
         )
     elif not isinstance(name, str):
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Field 'name' must be a string",
-                why=f"Got {type(name).__name__}.",
-                fix="Change 'name' to a string value.",
-                context={"path": result.config_path, "got_type": type(name).__name__},
-            )
+        _add_error(
+            result,
+            "Field 'name' must be a string",
+            why=f"Got {type(name).__name__}.",
+            fix="Change 'name' to a string value.",
+            got_type=type(name).__name__,
         )
     else:
         result.name = name
@@ -484,14 +530,12 @@ def _validate_config_data(
     if rules is None:
         rules = []
     if not isinstance(rules, list):
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Field 'rules' must be a list",
-                why=f"Got {type(rules).__name__}.",
-                fix="Change 'rules' to a list (or remove it for empty rules).",
-                context={"path": result.config_path, "got_type": type(rules).__name__},
-            )
+        _add_error(
+            result,
+            "Field 'rules' must be a list",
+            why=f"Got {type(rules).__name__}.",
+            fix="Change 'rules' to a list (or remove it for empty rules).",
+            got_type=type(rules).__name__,
         )
     else:
         result.rules_count = len(rules)
@@ -499,78 +543,59 @@ def _validate_config_data(
     # Validate states mapping
     states_mapping = data.get("states", {})
     if states_mapping is not None and not isinstance(states_mapping, dict):
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Field 'states' must be a mapping",
-                why=f"Got {type(states_mapping).__name__}.",
-                fix="Use format: states:\n  StateName: 'module:ClassName'",
-                context={"path": result.config_path, "got_type": type(states_mapping).__name__},
-            )
+        _add_error(
+            result,
+            "Field 'states' must be a mapping",
+            why=f"Got {type(states_mapping).__name__}.",
+            fix="Use format: states:\n  StateName: 'module:ClassName'",
+            got_type=type(states_mapping).__name__,
         )
         states_mapping = {}
 
-    # Resolve each state in the mapping
+    # Resolve each state in the mapping. Successes and failures are collected
+    # here so later steps don't walk result.states again.
+    resolved_states: Dict[str, type] = {}
+    failed_refs: List[StateResolution] = []
     if states_mapping:
+        add_state = result.states.append
         for key, dotted_path in states_mapping.items():
+            symbol = None
+            resolved = False
+            is_state_subclass = False
             if not isinstance(key, str) or not isinstance(dotted_path, str):
-                result.states.append(
-                    StateResolution(
-                        key=str(key),
-                        dotted_path=str(dotted_path) if dotted_path else None,
-                        resolved=False,
-                        is_state_subclass=False,
-                        error="Both key and value must be strings",
-                    )
-                )
-                continue
-
-            if ":" not in dotted_path:
-                result.states.append(
-                    StateResolution(
-                        key=key,
-                        dotted_path=dotted_path,
-                        resolved=False,
-                        is_state_subclass=False,
-                        error="Missing ':' separator (use 'module:ClassName' format)",
-                    )
-                )
-                continue
-
-            symbol, error = _try_import_symbol(dotted_path)
-            if error:
-                result.states.append(
-                    StateResolution(
-                        key=key,
-                        dotted_path=dotted_path,
-                        resolved=False,
-                        is_state_subclass=False,
-                        error=error,
-                    )
-                )
-            elif not isinstance(symbol, type) or not issubclass(symbol, State):
-                result.states.append(
-                    StateResolution(
-                        key=key,
-                        dotted_path=dotted_path,
-                        resolved=True,
-                        is_state_subclass=False,
-                        error=f"Not a State subclass (got {type(symbol).__name__})",
-                    )
-                )
+                key = str(key)
+                dotted_path = str(dotted_path) if dotted_path else None
+                error = "Both key and value must be strings"
+            elif ":" not in dotted_path:
+                error = "Missing ':' separator (use 'module:ClassName' format)"
             else:
-                result.states.append(
-                    StateResolution(
-                        key=key,
-                        dotted_path=dotted_path,
-                        resolved=True,
-                        is_state_subclass=True,
-                    )
-                )
+                symbol, error = _try_import_symbol(dotted_path)
+                if not error:
+                    resolved = True
+                    if isinstance(symbol, type) and issubclass(symbol, State):
+                        is_state_subclass = True
+                    else:
+                        error = f"Not a State subclass (got {type(symbol).__name__})"
+
+            state = StateResolution(
+                key=key,
+                dotted_path=dotted_path,
+                resolved=resolved,
+                is_state_subclass=is_state_subclass,
+                error=error,
+            )
+            add_state(state)
+            if is_state_subclass:
+                resolved_states[key] = symbol
+            else:
+                failed_refs.append(state)
 
     # Populate pack info (v0.4.0+)
-    # Use load_packs to normalize states/packs into StatePack list
-    _populate_pack_info(result, data, states_mapping)
+    # Use load_packs to normalize states/packs into StatePack list. A states
+    # mapping with failed entries never loads, so there is no pack to
+    # describe; the per-state errors below are the whole story.
+    if not failed_refs:
+        _populate_pack_info(result, data, states_mapping, resolved_states)
 
     # Parse resolution policy (v0.4.0+)
     _parse_resolution_policy(result, data)
@@ -578,14 +603,12 @@ def _validate_config_data(
     # Validate initial_state
     initial_state = data.get("initial_state", "InitialState")
     if not isinstance(initial_state, str):
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what="Field 'initial_state' must be a string",
-                why=f"Got {type(initial_state).__name__}.",
-                fix="Change 'initial_state' to a string value.",
-                context={"path": result.config_path, "got_type": type(initial_state).__name__},
-            )
+        _add_error(
+            result,
+            "Field 'initial_state' must be a string",
+            why=f"Got {type(initial_state).__name__}.",
+            fix="Change 'initial_state' to a string value.",
+            got_type=type(initial_state).__name__,
         )
     else:
         # Resolve initial_state
@@ -593,43 +616,35 @@ def _validate_config_data(
             # Dotted path - try to import
             symbol, error = _try_import_symbol(initial_state)
             if error:
-                result.errors.append(
-                    Diagnostic(
-                        level="error",
-                        what=f"Cannot resolve initial_state: {initial_state}",
-                        why=error,
-                        fix="Check the module path and class name.",
-                        context={"path": result.config_path, "initial_state": initial_state},
-                    )
+                _add_error(
+                    result,
+                    f"Cannot resolve initial_state: {initial_state}",
+                    why=error,
+                    fix="Check the module path and class name.",
+                    initial_state=initial_state,
                 )
             elif not isinstance(symbol, type) or not issubclass(symbol, State):
-                result.errors.append(
-                    Diagnostic(
-                        level="error",
-                        what=f"initial_state is not a State subclass",
-                        why=f"'{initial_state}' resolved to {type(symbol).__name__}.",
-                        fix="Ensure your class inherits from flexiflow.State.",
-                        context={"path": result.config_path, "initial_state": initial_state},
-                    )
+                _add_error(
+                    result,
+                    f"initial_state is not a State subclass",
+                    why=f"'{initial_state}' resolved to {type(symbol).__name__}.",
+                    fix="Ensure your class inherits from flexiflow.State.",
+                    initial_state=initial_state,
                 )
             else:
                 result.initial_state = symbol.__name__
         else:
-            # Plain state name - check if it exists
-            state_keys = [s.key for s in result.states if s.resolved and s.is_state_subclass]
-            all_valid = result.builtin_states + state_keys
-
-            if initial_state in all_valid:
+            # Plain state name - check if it exists; no concatenated copy is built
+            if initial_state in DEFAULT_REGISTRY or initial_state in resolved_states:
                 result.initial_state = initial_state
             else:
-                result.errors.append(
-                    Diagnostic(
-                        level="error",
-                        what=f"Unknown initial_state: '{initial_state}'",
-                        why="The state is not registered and not in the states mapping.",
-                        fix=f"Use one of: {', '.join(all_valid[:5])}",
-                        context={"path": result.config_path, "initial_state": initial_state},
-                    )
+                suggestions = islice(chain(result.builtin_states, resolved_states), 5)
+                _add_error(
+                    result,
+                    f"Unknown initial_state: '{initial_state}'",
+                    why="The state is not registered and not in the states mapping.",
+                    fix=f"Use one of: {', '.join(suggestions)}",
+                    initial_state=initial_state,
                 )
 
     # Add warnings for common issues
@@ -643,16 +658,15 @@ def _validate_config_data(
         )
 
     # Check for failed state resolutions
-    failed_states = [s for s in result.states if not s.resolved or not s.is_state_subclass]
-    for s in failed_states:
-        result.errors.append(
-            Diagnostic(
-                level="error",
-                what=f"State '{s.key}' failed to resolve",
-                why=s.error,
-                fix="Check the dotted path and ensure the module is importable.",
-                context={"key": s.key, "dotted_path": s.dotted_path},
-            )
+    result.errors.extend(
+        Diagnostic(
+            level="error",
+            what=f"State '{s.key}' failed to resolve",
+            why=s.error,
+            fix="Check the dotted path and ensure the module is importable.",
+            context={"key": s.key, "dotted_path": s.dotted_path},
         )
+        for s in failed_refs
+    )
 
     return result
@@ -8,10 +8,18 @@ from .persist_json import (
     ComponentSnapshot,
 )
 from .persist_sqlite import (
+    SnapshotStore,
+    configure_connection as configure_connection_sqlite,
     save_snapshot as save_snapshot_sqlite,
+    async_save_snapshot as async_save_snapshot_sqlite,
+    save_snapshots as save_snapshots_sqlite,
     load_latest_snapshot as load_latest_snapshot_sqlite,
     list_snapshots as list_snapshots_sqlite,
     prune_snapshots as prune_snapshots_sqlite,
+    save_transition as save_transition_sqlite,
+    save_transitions as save_transitions_sqlite,
+    list_transitions as list_transitions_sqlite,
+    prune_transitions as prune_transitions_sqlite,
 )
 
 __all__ = [
@@ -24,8 +32,16 @@ __all__ = [
     "restore_component",
     "ComponentSnapshot",
     # SQLite persistence
+    "SnapshotStore",
+    "configure_connection_sqlite",
     "save_snapshot_sqlite",
+    "async_save_snapshot_sqlite",
+    "save_snapshots_sqlite",
     "load_latest_snapshot_sqlite",
     "list_snapshots_sqlite",
     "prune_snapshots_sqlite",
+    "save_transition_sqlite",
+    "save_transitions_sqlite",
+    "list_transitions_sqlite",
+    "prune_transitions_sqlite",
 ]
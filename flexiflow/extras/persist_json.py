@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import os
+import re
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+from ..component import AsyncComponent
 from ..errors import (
     ErrorContext,
     PersistenceError,
@@ -14,9 +18,56 @@ from ..errors import (
     persistence_missing_field,
     state_not_found,
 )
+from ..state_machine import DEFAULT_REGISTRY, StateMachine
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
 
-@dataclass(frozen=True)
+
+# orjson writes NaN/Infinity as null and rejects integers wider than 64 bits;
+# decoding, it rejects NaN/Infinity and turns wide integers into floats. The
+# stdlib json module round-trips all of these, so such payloads go through it.
+# Any null might be a non-finite float and any 19+ digit run might be a wide
+# integer; both checks are plain substring/regex scans.
+_WIDE_DIGITS_BYTES = re.compile(rb"\d{19,}")
+_WIDE_DIGITS_TEXT = re.compile(r"\d{19,}")
+
+
+def _orjson_dumps(obj: object, option: int) -> Optional[bytes]:
+    """Encode with orjson, or return None if only json encodes obj faithfully."""
+    try:
+        raw = orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return None  # e.g. integers beyond 64 bits; json raises its own errors
+    if b"null" in raw:
+        return None
+    return raw
+
+
+def _dumps_indented(obj: object) -> bytes:
+    """Encode 2-space indented JSON as UTF-8, using orjson when installed."""
+    if orjson is not None:
+        raw = _orjson_dumps(obj, orjson.OPT_INDENT_2)
+        if raw is not None:
+            return raw
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _loads(raw: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text; raises json.JSONDecodeError on malformed input."""
+    if orjson is not None:
+        wide = _WIDE_DIGITS_BYTES if isinstance(raw, bytes) else _WIDE_DIGITS_TEXT
+        if wide.search(raw) is None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity tokens; json decides whether it's malformed
+    return json.loads(raw)
+
+
+@dataclass(frozen=True, slots=True)
 class ComponentSnapshot:
     """Serializable snapshot of component state."""
 
@@ -34,6 +85,9 @@ def save_component(
     """
     Save component state to a JSON file.
 
+    The snapshot is written to a temporary file next to the target and then
+    renamed over it, so readers never see a partially written file.
+
     Args:
         component: An AsyncComponent instance
         path: Path to the JSON file
@@ -52,8 +106,14 @@ def save_component(
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(snapshot, f, indent=2)
+    data = _dumps_indented(snapshot)
+    tmp = p.with_name(f".{p.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_snapshot(path: str | Path) -> ComponentSnapshot:
@@ -73,13 +133,11 @@ def load_snapshot(path: str | Path) -> ComponentSnapshot:
     p = Path(path)
     path_str = str(path)
 
-    if not p.exists():
-        raise FileNotFoundError(f"State file not found: {path}")
-
     try:
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        data = _loads(p.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"State file not found: {path}") from None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise persistence_invalid_json(path_str, str(e)) from None
 
     # Validate required fields
@@ -153,18 +211,15 @@ def restore_component(
     Raises:
         StateError: If the state class is not found in the registry
     """
-    from ..component import AsyncComponent
-    from ..state_machine import DEFAULT_REGISTRY, StateMachine
-
     reg = registry or DEFAULT_REGISTRY
 
     # Validate state exists in registry
-    if snapshot.current_state not in reg.names():
+    if snapshot.current_state not in reg:
         raise state_not_found(snapshot.current_state, reg.names())
 
     component = AsyncComponent(
         name=snapshot.name,
-        rules=list(snapshot.rules),
+        rules=snapshot.rules,
         state_machine=StateMachine.from_name(snapshot.current_state, registry=reg),
     )
 
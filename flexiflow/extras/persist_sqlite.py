@@ -3,20 +3,115 @@
 This adapter stores every snapshot indefinitely. Callers should implement
 retention/cleanup if storage growth is a concern. Use prune_snapshots() to
 delete old snapshots while keeping the most recent N per component.
+
+Full snapshots carry the rules list and are relatively large. For frequent
+state changes, record a lightweight transition with save_transition() and
+write a full snapshot only when rules change; load_latest_snapshot() applies
+the newest transition on top of the latest full snapshot.
+
+configure_connection() opts a connection into WAL with synchronous=NORMAL,
+which is the usual setup for frequent small writes. SnapshotStore keeps such
+connections open for a database file: one writer plus a few read-only
+connections, so threads don't reconnect or re-apply PRAGMAs per call.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .persist_json import ComponentSnapshot, _loads, _orjson_dumps
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+# Rows per multi-VALUES INSERT; keeps bound parameters under SQLite's
+# historical 999-variable limit.
+_ROWS_PER_INSERT = 300
+
+# Column lists for inserts. SQL text is built once so repeated saves pass
+# identical strings and hit sqlite3's per-connection statement cache.
+_SNAPSHOT_COLUMNS = "flexiflow_snapshots (component_name, snapshot_json, created_at)"
+_TRANSITION_COLUMNS = "flexiflow_transitions (component_name, to_state, created_at)"
+_INSERT_SNAPSHOT_SQL = f"INSERT INTO {_SNAPSHOT_COLUMNS} VALUES (?, ?, ?)"
+_INSERT_TRANSITION_SQL = f"INSERT INTO {_TRANSITION_COLUMNS} VALUES (?, ?, ?)"
+
+# Single-statement retention: delete every row of a component that is not
+# among its newest ?2 rows (newest by created_at, ties broken by id).
+_PRUNE_SQL = """
+    DELETE FROM {table}
+    WHERE component_name = ?1 AND id NOT IN (
+        SELECT id FROM {table}
+        WHERE component_name = ?1
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?2
+    )
+"""
+_PRUNE_SNAPSHOTS_SQL = _PRUNE_SQL.format(table="flexiflow_snapshots")
+_PRUNE_TRANSITIONS_SQL = _PRUNE_SQL.format(table="flexiflow_transitions")
+
+# Per-connection write locks for async_save_snapshot(): id(conn) ->
+# [lock, callers using it]. Connections accept neither attributes nor weak
+# references, so entries are keyed by id() and dropped once no caller holds
+# one; while any caller does, the connection is alive and its id can't be
+# reused. Threading locks (taken in the worker thread) serialize across
+# threads and event loops.
+_write_locks: Dict[int, List] = {}
+_write_locks_guard = threading.Lock()
+
+# Loop-side queue in front of the threading lock: (id(loop), id(conn)) ->
+# [asyncio.Lock, callers using it]. Producers wait here without occupying
+# an executor thread, so a burst on one connection uses one thread at a
+# time. Keyed per loop because an asyncio.Lock binds to one event loop;
+# each loop only touches its own entries, from its own thread.
+_async_write_locks: Dict[Tuple[int, int], List] = {}
+
+# list_snapshots() only needs current_state, so SQLite extracts it instead of
+# returning whole payloads. json_valid() guards json_extract(), which raises
+# on malformed rows. It also rejects the NaN/Infinity tokens the stdlib
+# encoder writes, so rows it rejects return their payload for a Python parse.
+_LIST_SNAPSHOTS_SQL = """
+    SELECT id, created_at,
+           CASE WHEN json_valid(snapshot_json)
+                THEN json_extract(snapshot_json, '$.current_state') END,
+           CASE WHEN NOT json_valid(snapshot_json) THEN snapshot_json END
+    FROM flexiflow_snapshots
+    WHERE component_name = ?
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+
+
+# The migration creates this index last, so its presence means the tables
+# exist and both indexes are current. One sqlite_master read replaces six
+# IF [NOT] EXISTS DDL statements per call.
+_SCHEMA_CURRENT_SQL = (
+    "SELECT 1 FROM sqlite_master WHERE type = 'index'"
+    " AND name = 'idx_flexiflow_transitions_component_created_id'"
+)
 
-from .persist_json import ComponentSnapshot
 
+def _ensure_table(conn: sqlite3.Connection, *, migrate: bool = True) -> None:
+    """Create the snapshots and transitions tables if they don't exist.
 
-def _ensure_table(conn: sqlite3.Connection) -> None:
-    """Create the snapshots table if it doesn't exist."""
+    With migrate=True (write paths) also brings the indexes up to date.
+    Read paths pass migrate=False: they only run IF NOT EXISTS statements,
+    which are no-ops on an existing schema, so they stay usable on read-only
+    connections to databases that still carry the old indexes.
+    """
+    if conn.execute(_SCHEMA_CURRENT_SQL).fetchone() is not None:
+        return
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS flexiflow_snapshots (
@@ -29,17 +124,120 @@ def _ensure_table(conn: sqlite3.Connection) -> None:
     )
     conn.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_flexiflow_snapshots_component_created
-        ON flexiflow_snapshots (component_name, created_at DESC)
+        CREATE TABLE IF NOT EXISTS flexiflow_transitions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            component_name TEXT NOT NULL,
+            to_state TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """
+    )
+    if migrate:
+        _migrate_indexes(conn)
+
+
+def _migrate_indexes(conn: sqlite3.Connection) -> None:
+    """Create the lookup indexes, replacing the earlier created_at-only ones.
+
+    The (created_at DESC, id DESC) indexes match the ordering of every
+    lookup, so latest/list/prune queries walk them without a sort step. This
+    writes to the schema, so it runs on write paths only; reads on databases
+    that still carry the old indexes work, just with a sort step. Creates
+    the index _SCHEMA_CURRENT_SQL probes for last.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_flexiflow_snapshots_component_created")
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_flexiflow_snapshots_component_created_id
+        ON flexiflow_snapshots (component_name, created_at DESC, id DESC)
+        """
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_flexiflow_transitions_component_created")
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_flexiflow_transitions_component_created_id
+        ON flexiflow_transitions (component_name, created_at DESC, id DESC)
         """
     )
 
 
+def _dumps(obj: object) -> str:
+    """Encode compact JSON text, using orjson when it is installed.
+
+    Non-str keys (YAML loads `on:` as True and `1:` as 1) are converted to
+    strings by both encoders, as the stdlib json module always did. Values
+    orjson can't represent faithfully (wide integers, NaN/Infinity) are
+    encoded by the stdlib json module instead.
+    """
+    if orjson is not None:
+        raw = _orjson_dumps(obj, 0)
+        if raw is not None:
+            return raw.decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _snapshot_payload(snapshot: ComponentSnapshot) -> str:
+    """Serialize a snapshot to the stored JSON text."""
+    return _dumps(
+        {
+            "name": snapshot.name,
+            "current_state": snapshot.current_state,
+            "rules": snapshot.rules,
+            "metadata": snapshot.metadata,
+        }
+    )
+
+
+def _insert_rows(
+    conn: sqlite3.Connection,
+    table_and_columns: str,
+    rows: Sequence[Tuple[str, str, str]],
+) -> None:
+    """Insert 3-column rows using multi-row VALUES statements."""
+    for start in range(0, len(rows), _ROWS_PER_INSERT):
+        chunk = rows[start : start + _ROWS_PER_INSERT]
+        params = [value for row in chunk for value in row]
+        conn.execute(_multi_insert_sql(table_and_columns, len(chunk)), params)
+
+
+@functools.lru_cache(maxsize=64)
+def _multi_insert_sql(table_and_columns: str, row_count: int) -> str:
+    """INSERT text with row_count 3-value tuples."""
+    placeholders = ", ".join(["(?, ?, ?)"] * row_count)
+    return f"INSERT INTO {table_and_columns} VALUES {placeholders}"
+
+
+def configure_connection(conn: sqlite3.Connection) -> str:
+    """
+    Apply write-friendly PRAGMAs to a connection used for persistence.
+
+    Switches the database to WAL with synchronous=NORMAL, so a commit costs
+    one fsync instead of two and readers don't block the writer. Also sets
+    a 5 s busy timeout, in-memory temp storage and a 64 MiB page cache.
+    Safe to call more than once. It is opt-in because journal_mode=WAL
+    persists in the database file and affects every other connection to it.
+
+    Args:
+        conn: SQLite connection
+
+    Returns:
+        The journal mode now in effect ("wal", or e.g. "memory" for
+        in-memory databases that cannot use WAL)
+    """
+    journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    return journal_mode.lower()
+
+
 def save_snapshot(
     conn: sqlite3.Connection,
     snapshot: ComponentSnapshot,
     *,
     created_at: Optional[datetime] = None,
+    commit: bool = True,
 ) -> int:
     """
     Save a component snapshot to SQLite.
@@ -48,6 +246,8 @@ def save_snapshot(
         conn: SQLite connection
         snapshot: ComponentSnapshot to persist
         created_at: Optional timestamp (defaults to now UTC)
+        commit: Commit after the insert (default True). Pass False to group
+            several writes into one caller-managed transaction.
 
     Returns:
         The row ID of the inserted snapshot
@@ -55,26 +255,177 @@ def save_snapshot(
     _ensure_table(conn)
 
     timestamp = created_at or datetime.now(timezone.utc)
-    payload = json.dumps(
-        {
-            "name": snapshot.name,
-            "current_state": snapshot.current_state,
-            "rules": snapshot.rules,
-            "metadata": snapshot.metadata,
-        }
+    payload = _snapshot_payload(snapshot)
+
+    cursor = conn.execute(
+        _INSERT_SNAPSHOT_SQL, (snapshot.name, payload, timestamp.isoformat())
     )
+    if commit:
+        conn.commit()
+    return cursor.lastrowid  # type: ignore[return-value]
+
+
+async def async_save_snapshot(
+    conn: sqlite3.Connection,
+    snapshot: ComponentSnapshot,
+    *,
+    created_at: Optional[datetime] = None,
+) -> int:
+    """
+    Save a snapshot from async code without blocking the event loop.
+
+    Runs save_snapshot() in a worker thread. Concurrent producers sharing a
+    connection take turns instead of contending inside SQLite; they wait on
+    the event loop, so only one executor thread per connection is in use.
+    Saves on other connections don't wait. This is the recommended path for
+    saving from multiple tasks. The connection must be opened with
+    check_same_thread=False.
+
+    Args:
+        conn: SQLite connection
+        snapshot: ComponentSnapshot to persist
+        created_at: Optional timestamp (defaults to now UTC)
+
+    Returns:
+        The row ID of the inserted snapshot
+    """
+    key = (id(asyncio.get_running_loop()), id(conn))
+    entry = _async_write_locks.get(key)
+    if entry is None:
+        entry = _async_write_locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            return await asyncio.to_thread(
+                _save_snapshot_locked, conn, snapshot, created_at
+            )
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _async_write_locks[key]
+
+
+@contextmanager
+def _connection_write_lock(conn: sqlite3.Connection) -> Iterator[None]:
+    """Hold the write lock for one connection."""
+    key = id(conn)
+    with _write_locks_guard:
+        entry = _write_locks.get(key)
+        if entry is None:
+            entry = _write_locks[key] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _write_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _write_locks[key]
+
+
+def _save_snapshot_locked(
+    conn: sqlite3.Connection,
+    snapshot: ComponentSnapshot,
+    created_at: Optional[datetime],
+) -> int:
+    with _connection_write_lock(conn):
+        return save_snapshot(conn, snapshot, created_at=created_at)
+
+
+def save_snapshots(
+    conn: sqlite3.Connection,
+    snapshots: Iterable[ComponentSnapshot],
+    *,
+    created_at: Optional[datetime] = None,
+    commit: bool = True,
+) -> int:
+    """
+    Save several snapshots with multi-row INSERT statements.
+
+    All rows share one timestamp; rows saved later in the same call sort as
+    newer (ties are broken by row ID).
+
+    Args:
+        conn: SQLite connection
+        snapshots: ComponentSnapshots to persist, oldest first
+        created_at: Optional timestamp (defaults to now UTC)
+        commit: Commit after the inserts (default True)
+
+    Returns:
+        Number of snapshots inserted
+    """
+    _ensure_table(conn)
+
+    ts = (created_at or datetime.now(timezone.utc)).isoformat()
+    rows = [(s.name, _snapshot_payload(s), ts) for s in snapshots]
+    _insert_rows(conn, _SNAPSHOT_COLUMNS, rows)
+    if commit:
+        conn.commit()
+    return len(rows)
+
+
+def save_transition(
+    conn: sqlite3.Connection,
+    component_name: str,
+    to_state: str,
+    *,
+    created_at: Optional[datetime] = None,
+    commit: bool = True,
+) -> int:
+    """
+    Record a state transition without rewriting the full snapshot.
+
+    Args:
+        conn: SQLite connection
+        component_name: Name of the component that transitioned
+        to_state: Name of the state it transitioned to
+        created_at: Optional timestamp (defaults to now UTC)
+        commit: Commit after the insert (default True)
+
+    Returns:
+        The row ID of the inserted transition
+    """
+    _ensure_table(conn)
 
+    timestamp = created_at or datetime.now(timezone.utc)
     cursor = conn.execute(
-        """
-        INSERT INTO flexiflow_snapshots (component_name, snapshot_json, created_at)
-        VALUES (?, ?, ?)
-        """,
-        (snapshot.name, payload, timestamp.isoformat()),
+        _INSERT_TRANSITION_SQL, (component_name, to_state, timestamp.isoformat())
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     return cursor.lastrowid  # type: ignore[return-value]
 
 
+def save_transitions(
+    conn: sqlite3.Connection,
+    transitions: Iterable[Tuple[str, str]],
+    *,
+    created_at: Optional[datetime] = None,
+    commit: bool = True,
+) -> int:
+    """
+    Record several transitions with multi-row INSERT statements.
+
+    Args:
+        conn: SQLite connection
+        transitions: (component_name, to_state) pairs, oldest first
+        created_at: Optional timestamp (defaults to now UTC)
+        commit: Commit after the inserts (default True)
+
+    Returns:
+        Number of transitions inserted
+    """
+    _ensure_table(conn)
+
+    ts = (created_at or datetime.now(timezone.utc)).isoformat()
+    rows = [(name, to_state, ts) for name, to_state in transitions]
+    _insert_rows(conn, _TRANSITION_COLUMNS, rows)
+    if commit:
+        conn.commit()
+    return len(rows)
+
+
 def load_latest_snapshot(
     conn: sqlite3.Connection,
     component_name: str,
@@ -82,6 +433,9 @@ def load_latest_snapshot(
     """
     Load the most recent snapshot for a component.
 
+    If a transition was recorded at or after the snapshot, the snapshot's
+    current_state is replaced by the newest transition's to_state.
+
     Args:
         conn: SQLite connection
         component_name: Name of the component to load
@@ -92,13 +446,13 @@ def load_latest_snapshot(
     Raises:
         ValueError: If the stored JSON is invalid
     """
-    _ensure_table(conn)
+    _ensure_table(conn, migrate=False)
 
     cursor = conn.execute(
         """
-        SELECT snapshot_json FROM flexiflow_snapshots
+        SELECT snapshot_json, created_at FROM flexiflow_snapshots
         WHERE component_name = ?
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, id DESC
         LIMIT 1
         """,
         (component_name,),
@@ -109,7 +463,7 @@ def load_latest_snapshot(
         return None
 
     try:
-        data = json.loads(row[0])
+        data = _loads(row[0])
     except json.JSONDecodeError as e:
         from ..errors import ErrorContext, PersistenceError
 
@@ -124,9 +478,22 @@ def load_latest_snapshot(
             context=ctx,
         ) from None
 
+    current_state = data["current_state"]
+    transition = conn.execute(
+        """
+        SELECT to_state FROM flexiflow_transitions
+        WHERE component_name = ? AND created_at >= ?
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1
+        """,
+        (component_name, row[1]),
+    ).fetchone()
+    if transition is not None:
+        current_state = transition[0]
+
     return ComponentSnapshot(
         name=data["name"],
-        current_state=data["current_state"],
+        current_state=current_state,
         rules=data.get("rules", []),
         metadata=data.get("metadata", {}),
     )
@@ -149,35 +516,95 @@ def list_snapshots(
     Returns:
         List of dicts with 'id', 'created_at', and 'current_state' keys
     """
-    _ensure_table(conn)
+    _ensure_table(conn, migrate=False)
+
+    try:
+        rows = conn.execute(_LIST_SNAPSHOTS_SQL, (component_name, limit)).fetchall()
+    except sqlite3.OperationalError as e:
+        # SQLite built without JSON1: parse each payload in Python instead.
+        if "no such function" not in str(e):
+            raise
+        return _list_snapshots_parsed(conn, component_name, limit)
+
+    return [
+        {
+            "id": row_id,
+            "created_at": created_at,
+            "current_state": (
+                _payload_current_state(payload)
+                if payload is not None
+                else "unknown" if state is None else state
+            ),
+        }
+        for row_id, created_at, state, payload in rows
+    ]
+
 
+def _payload_current_state(payload: str) -> object:
+    """current_state of a stored payload, "unknown" if absent, "invalid" if malformed."""
+    try:
+        return _loads(payload).get("current_state", "unknown")
+    except json.JSONDecodeError:
+        return "invalid"
+
+
+def _list_snapshots_parsed(
+    conn: sqlite3.Connection, component_name: str, limit: int
+) -> List[dict]:
+    """list_snapshots() for SQLite builds without the JSON1 functions."""
     cursor = conn.execute(
         """
         SELECT id, snapshot_json, created_at FROM flexiflow_snapshots
         WHERE component_name = ?
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, id DESC
         LIMIT ?
         """,
         (component_name, limit),
     )
 
-    results = []
-    for row in cursor:
-        try:
-            data = json.loads(row[1])
-            current_state = data.get("current_state", "unknown")
-        except json.JSONDecodeError:
-            current_state = "invalid"
-
-        results.append(
-            {
-                "id": row[0],
-                "created_at": row[2],
-                "current_state": current_state,
-            }
-        )
+    return [
+        {
+            "id": row_id,
+            "created_at": created_at,
+            "current_state": _payload_current_state(payload),
+        }
+        for row_id, payload, created_at in cursor
+    ]
 
-    return results
+
+def list_transitions(
+    conn: sqlite3.Connection,
+    component_name: str,
+    *,
+    limit: int = 10,
+) -> List[dict]:
+    """
+    List recent state transitions for a component.
+
+    Args:
+        conn: SQLite connection
+        component_name: Name of the component
+        limit: Maximum number of transitions to return (default 10)
+
+    Returns:
+        List of dicts with 'id', 'created_at', and 'current_state' keys
+    """
+    _ensure_table(conn, migrate=False)
+
+    cursor = conn.execute(
+        """
+        SELECT id, to_state, created_at FROM flexiflow_transitions
+        WHERE component_name = ?
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+        """,
+        (component_name, limit),
+    )
+
+    return [
+        {"id": row[0], "created_at": row[2], "current_state": row[1]}
+        for row in cursor
+    ]
 
 
 def prune_snapshots(
@@ -199,31 +626,167 @@ def prune_snapshots(
     """
     _ensure_table(conn)
 
-    # Find the cutoff ID (the Nth most recent)
-    cursor = conn.execute(
-        """
-        SELECT id FROM flexiflow_snapshots
-        WHERE component_name = ?
-        ORDER BY created_at DESC
-        LIMIT 1 OFFSET ?
-        """,
-        (component_name, keep_last),
-    )
-    cutoff_row = cursor.fetchone()
+    # Keep the newest keep_last rows by the same ordering every lookup uses
+    cursor = conn.execute(_PRUNE_SNAPSHOTS_SQL, (component_name, keep_last))
+    conn.commit()
+    return cursor.rowcount
+
 
-    if cutoff_row is None:
-        # Fewer than keep_last snapshots exist, nothing to prune
-        return 0
+def prune_transitions(
+    conn: sqlite3.Connection,
+    component_name: str,
+    *,
+    keep_last: int = 10,
+) -> int:
+    """
+    Delete old transitions, keeping only the most recent N.
 
-    cutoff_id = cutoff_row[0]
+    Args:
+        conn: SQLite connection
+        component_name: Name of the component to prune
+        keep_last: Number of most recent transitions to keep (default 10)
 
-    # Delete all rows older than or equal to the cutoff
-    cursor = conn.execute(
-        """
-        DELETE FROM flexiflow_snapshots
-        WHERE component_name = ? AND id <= ?
-        """,
-        (component_name, cutoff_id),
-    )
+    Returns:
+        Number of rows deleted
+    """
+    _ensure_table(conn)
+
+    cursor = conn.execute(_PRUNE_TRANSITIONS_SQL, (component_name, keep_last))
     conn.commit()
     return cursor.rowcount
+
+
+class SnapshotStore:
+    """
+    Long-lived connections to one database file, shared across threads.
+
+    Writes go through a single writer connection guarded by a lock. Reads
+    borrow one of pool_size read-only connections, which under WAL proceed
+    while a write is in progress. Every connection is configured once with
+    configure_connection(). With pool_size=0, or for ":memory:" databases
+    (which cannot be shared between connections), reads use the writer.
+
+    Methods mirror the module functions without the conn argument. From
+    async code, call them via asyncio.to_thread().
+
+    Example:
+        with SnapshotStore("state.db") as store:
+            store.save_snapshot(snapshot)
+            latest = store.load_latest_snapshot("my_component")
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike], *, pool_size: int = 4
+    ) -> None:
+        in_memory = str(path) == ":memory:"
+        self._writer = sqlite3.connect(str(path), check_same_thread=False)
+        self._write_lock = threading.Lock()
+        configure_connection(self._writer)
+        # Readers open with mode=ro and can't create the schema themselves
+        _ensure_table(self._writer)
+        self._writer.commit()
+
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        if not in_memory:
+            uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+            for _ in range(pool_size):
+                reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+                configure_connection(reader)
+                self._readers.put(reader)
+        self._pool_size = self._readers.qsize()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            yield self._writer
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        if not self._pool_size:
+            with self._write() as conn:
+                yield conn
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def save_snapshot(
+        self,
+        snapshot: ComponentSnapshot,
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> int:
+        """See save_snapshot()."""
+        with self._write() as conn:
+            return save_snapshot(conn, snapshot, created_at=created_at)
+
+    def save_snapshots(
+        self,
+        snapshots: Iterable[ComponentSnapshot],
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> int:
+        """See save_snapshots()."""
+        with self._write() as conn:
+            return save_snapshots(conn, snapshots, created_at=created_at)
+
+    def save_transition(
+        self,
+        component_name: str,
+        to_state: str,
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> int:
+        """See save_transition()."""
+        with self._write() as conn:
+            return save_transition(conn, component_name, to_state, created_at=created_at)
+
+    def save_transitions(
+        self,
+        transitions: Iterable[Tuple[str, str]],
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> int:
+        """See save_transitions()."""
+        with self._write() as conn:
+            return save_transitions(conn, transitions, created_at=created_at)
+
+    def load_latest_snapshot(self, component_name: str) -> Optional[ComponentSnapshot]:
+        """See load_latest_snapshot()."""
+        with self._read() as conn:
+            return load_latest_snapshot(conn, component_name)
+
+    def list_snapshots(self, component_name: str, *, limit: int = 10) -> List[dict]:
+        """See list_snapshots()."""
+        with self._read() as conn:
+            return list_snapshots(conn, component_name, limit=limit)
+
+    def list_transitions(self, component_name: str, *, limit: int = 10) -> List[dict]:
+        """See list_transitions()."""
+        with self._read() as conn:
+            return list_transitions(conn, component_name, limit=limit)
+
+    def prune_snapshots(self, component_name: str, *, keep_last: int = 10) -> int:
+        """See prune_snapshots()."""
+        with self._write() as conn:
+            return prune_snapshots(conn, component_name, keep_last=keep_last)
+
+    def prune_transitions(self, component_name: str, *, keep_last: int = 10) -> int:
+        """See prune_transitions()."""
+        with self._write() as conn:
+            return prune_transitions(conn, component_name, keep_last=keep_last)
+
+    def close(self) -> None:
+        """Close the writer and all idle read connections."""
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+        with self._write_lock:
+            self._writer.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
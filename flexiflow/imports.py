@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import importlib
-from typing import Any
+import sys
+from types import ModuleType
+from typing import Any, Dict, Tuple
 
 from .errors import (
     import_invalid_format,
@@ -12,6 +14,44 @@ from .errors import (
 )
 
 
+# Successful resolutions: dotted path -> (module_path, symbol_name, module,
+# symbol). An entry is only reused while sys.modules still holds the same
+# module and the module still binds the same symbol, so removals and
+# reloads are picked up. Failures are never cached.
+_MISSING = object()
+_SYMBOL_CACHE: Dict[str, Tuple[str, str, ModuleType, Any]] = {}
+
+
+def _cached_symbol(dotted: str) -> Any:
+    """Return the cached symbol for a dotted path, or _MISSING."""
+    cached = _SYMBOL_CACHE.get(dotted)
+    if cached is None:
+        return _MISSING
+    module_path, symbol_name, module, symbol = cached
+    if (
+        sys.modules.get(module_path) is module
+        and module.__dict__.get(symbol_name, _MISSING) is symbol
+    ):
+        return symbol
+    del _SYMBOL_CACHE[dotted]
+    return _MISSING
+
+
+def _import_module(module_path: str) -> ModuleType:
+    """Import a module; already-imported modules skip the import machinery."""
+    module = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+    return module
+
+
+def _cache_symbol(
+    dotted: str, module_path: str, symbol_name: str, module: ModuleType, symbol: Any
+) -> None:
+    """Remember a successful resolution for _cached_symbol()."""
+    _SYMBOL_CACHE[dotted] = (module_path, symbol_name, module, symbol)
+
+
 def load_symbol(dotted: str) -> Any:
     """
     Load a symbol from 'package.module:SymbolName'.
@@ -26,10 +66,14 @@ def load_symbol(dotted: str) -> Any:
         ImportError_: If the format is invalid, module can't be imported,
                       or symbol doesn't exist in the module.
     """
-    if ":" not in dotted:
+    symbol = _cached_symbol(dotted)
+    if symbol is not _MISSING:
+        return symbol
+
+    module_path, sep, symbol_name = dotted.partition(":")
+    if not sep:
         raise import_invalid_format(dotted)
 
-    module_path, symbol_name = dotted.split(":", 1)
     module_path = module_path.strip()
     symbol_name = symbol_name.strip()
 
@@ -37,11 +81,14 @@ def load_symbol(dotted: str) -> Any:
         raise import_invalid_format(dotted)
 
     try:
-        module = importlib.import_module(module_path)
+        module = _import_module(module_path)
     except Exception:
         raise import_module_not_found(module_path, dotted) from None
 
     try:
-        return getattr(module, symbol_name)
+        symbol = getattr(module, symbol_name)
     except AttributeError:
         raise import_symbol_not_found(module_path, symbol_name, dotted) from None
+
+    _cache_symbol(dotted, module_path, symbol_name, module, symbol)
+    return symbol
@@ -13,10 +13,11 @@ Collision rules:
 
 from __future__ import annotations
 
-import importlib
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Set, Type, Union
 
 from .errors import ConfigError, ErrorContext, ImportError_
+from .imports import _MISSING, _cache_symbol, _cached_symbol, _import_module
 from .statepack import MappingPack, StateSpec, StatePack
 
 
@@ -28,11 +29,10 @@ def _is_statepack_instance(obj: Any) -> bool:
     # Exclude classes - we want actual instances
     if isinstance(obj, type):
         return False
+    # getattr(..., None) yields a non-callable None for missing methods, so
+    # only `name` needs a separate hasattr
     return (
         hasattr(obj, "name")
-        and hasattr(obj, "provides")
-        and hasattr(obj, "transitions")
-        and hasattr(obj, "depends_on")
         and callable(getattr(obj, "provides", None))
         and callable(getattr(obj, "transitions", None))
         and callable(getattr(obj, "depends_on", None))
@@ -52,24 +52,10 @@ def _is_statepack_class(cls: Any) -> bool:
     )
 
 
-def _load_pack_from_dotted_path(dotted_path: str) -> StatePack:
-    """Load a StatePack from a dotted path.
-
-    Supports:
-        - "module.path:PackClass" → instantiates PackClass()
-        - "module.path:pack_instance" → uses instance directly
-
-    Args:
-        dotted_path: Import path in "module:symbol" format.
-
-    Returns:
-        StatePack instance.
-
-    Raises:
-        ImportError_: If path format is invalid or import fails.
-        ConfigError: If imported object is not a StatePack.
-    """
-    if ":" not in dotted_path:
+def _import_pack_symbol(dotted_path: str) -> Any:
+    """Resolve "module:symbol" for a pack path, caching the result."""
+    module_path, sep, symbol_name = dotted_path.partition(":")
+    if not sep:
         ctx = ErrorContext().add("dotted_path", dotted_path)
         raise ImportError_(
             f"Invalid pack path format: '{dotted_path}'",
@@ -78,7 +64,6 @@ def _load_pack_from_dotted_path(dotted_path: str) -> StatePack:
             context=ctx,
         )
 
-    module_path, symbol_name = dotted_path.split(":", 1)
     module_path = module_path.strip()
     symbol_name = symbol_name.strip()
 
@@ -93,7 +78,7 @@ def _load_pack_from_dotted_path(dotted_path: str) -> StatePack:
 
     # Import module
     try:
-        module = importlib.import_module(module_path)
+        module = _import_module(module_path)
     except Exception:
         ctx = ErrorContext().add("module", module_path).add("dotted_path", dotted_path)
         raise ImportError_(
@@ -120,6 +105,31 @@ def _load_pack_from_dotted_path(dotted_path: str) -> StatePack:
             context=ctx,
         ) from None
 
+    _cache_symbol(dotted_path, module_path, symbol_name, module, symbol)
+    return symbol
+
+
+def _load_pack_from_dotted_path(dotted_path: str) -> StatePack:
+    """Load a StatePack from a dotted path.
+
+    Supports:
+        - "module.path:PackClass" → instantiates PackClass()
+        - "module.path:pack_instance" → uses instance directly
+
+    Args:
+        dotted_path: Import path in "module:symbol" format.
+
+    Returns:
+        StatePack instance.
+
+    Raises:
+        ImportError_: If path format is invalid or import fails.
+        ConfigError: If imported object is not a StatePack.
+    """
+    symbol = _cached_symbol(dotted_path)
+    if symbol is _MISSING:
+        symbol = _import_pack_symbol(dotted_path)
+
     # Handle instance vs class
     if _is_statepack_instance(symbol):
         return symbol  # type: ignore
@@ -163,19 +173,28 @@ def _detect_collisions(
     """
     errors: List[ConfigError] = []
 
-    # Track which pack provides each key
-    key_providers: Dict[str, List[str]] = {}  # key -> [pack_names]
-
-    for pack in packs:
-        pack_name = pack.name
-        for key in pack.provides().keys():
-            if key not in key_providers:
-                key_providers[key] = []
-            key_providers[key].append(pack_name)
+    # Count keys first; provider lists are only built for offending keys,
+    # which keeps the usual collision-free case to a Counter and one set op.
+    provided = [(pack.name, pack.provides()) for pack in packs]
+    key_counts = Counter(key for _, keys in provided for key in keys)
+    duplicate_keys = {key for key, count in key_counts.items() if count > 1}
+    shadowed_keys = key_counts.keys() & builtin_keys
+    if not duplicate_keys and not shadowed_keys:
+        return errors
+
+    # Track which pack provides each offending key, in first-seen order
+    offending = duplicate_keys | shadowed_keys
+    key_providers: Dict[str, List[str]] = {
+        key: [] for key in key_counts if key in offending
+    }
+    for pack_name, keys in provided:
+        for key in keys:
+            if key in offending:
+                key_providers[key].append(pack_name)
 
     # Check for duplicate keys across packs
     for key, providers in key_providers.items():
-        if len(providers) > 1:
+        if key in duplicate_keys:
             ctx = ErrorContext().add("key", key).add("providers", providers)
             errors.append(
                 ConfigError(
@@ -188,7 +207,7 @@ def _detect_collisions(
 
     # Check for shadowing builtins
     for key in key_providers.keys():
-        if key in builtin_keys:
+        if key in shadowed_keys:
             providers = key_providers[key]
             ctx = (
                 ErrorContext()
@@ -291,18 +310,27 @@ def load_packs(
     return result
 
 
-def collect_provided_keys(packs: List[StatePack]) -> Dict[str, str]:
+def collect_provided_keys(
+    packs: List[StatePack],
+    *,
+    provided: Optional[Sequence[Dict[str, StateSpec]]] = None,
+) -> Dict[str, str]:
     """Collect all state keys provided by packs with attribution.
 
     Args:
         packs: List of StatePack instances.
+        provided: Optional pack.provides() results, in pack order, for callers
+            that already computed them. Avoids calling provides() again.
 
     Returns:
         Dict mapping state key to pack name that provides it.
     """
+    if provided is None:
+        provided = [pack.provides() for pack in packs]
     result: Dict[str, str] = {}
-    for pack in packs:
-        for key in pack.provides().keys():
+    for pack, keys in zip(packs, provided):
+        pack_name = pack.name
+        for key in keys:
             if key not in result:  # First provider wins (collision already detected)
-                result[key] = pack.name
+                result[key] = pack_name
     return result
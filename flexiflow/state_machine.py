@@ -9,6 +9,12 @@ Message = Dict[str, Any]
 
 
 class State:
+    """Base state. handle_message returns (proceed, next_state) for one message.
+
+    The message dict is passed through unchanged; read ``message.get("type")``
+    once per call and dispatch on the local value.
+    """
+
     async def handle_message(self, message: Message, component: Any) -> Tuple[bool, "State"]:
         raise NotImplementedError
 
@@ -32,6 +38,9 @@ class StateRegistry:
     def names(self) -> list[str]:
         return sorted(self._states.keys())
 
+    def __contains__(self, name: object) -> bool:
+        return name in self._states
+
 
 class InitialState(State):
     async def handle_message(self, message: Message, component: Any) -> Tuple[bool, State]:
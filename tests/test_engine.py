@@ -45,3 +45,50 @@ def test_multiple_components():
     assert engine.get("comp1") is c1
     assert engine.get("comp2") is c2
     assert len(engine.components) == 2
+
+
+async def test_component_copies_shared_rules_on_first_mutation():
+    """Rules passed in are shared until the component mutates them."""
+    source = [{"rule1": "x"}]
+    c = AsyncComponent(name="c", rules=source, state_machine=StateMachine.from_name("InitialState"))
+    assert c.rules is source
+
+    await c.add_rule({"rule2": "y"})
+    await c.update_rules([{"rule3": "z"}])
+
+    assert source == [{"rule1": "x"}]
+    assert c.rules == [{"rule1": "x"}, {"rule2": "y"}, {"rule3": "z"}]
+
+
+async def test_register_inside_loop_schedules_registered_event():
+    """register() inside a running loop publishes engine.component.registered."""
+    import asyncio
+
+    engine = FlexiFlowEngine()
+    seen = []
+
+    async def on_registered(data):
+        seen.append(data["component"])
+
+    await engine.event_bus.subscribe("engine.component.registered", "test", on_registered)
+    engine.register(AsyncComponent(name="c", state_machine=StateMachine.from_name("InitialState")))
+
+    await asyncio.sleep(0)
+    assert seen == ["c"]
+
+
+async def test_register_delivers_to_handler_subscribed_afterwards():
+    """A handler subscribed right after register() still gets the event."""
+    import asyncio
+
+    engine = FlexiFlowEngine()
+    seen = []
+
+    async def on_registered(data):
+        seen.append(data["component"])
+
+    engine.register(AsyncComponent(name="c", state_machine=StateMachine.from_name("InitialState")))
+    await engine.event_bus.subscribe("engine.component.registered", "test", on_registered)
+
+    await asyncio.sleep(0)
+    assert seen == ["c"]
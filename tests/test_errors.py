@@ -81,6 +81,41 @@ def test_flexiflow_error_full():
     assert "key='value'" in msg
 
 
+def test_flexiflow_error_formats_lazily():
+    """Context values are only repr'd when the error is rendered."""
+    calls = []
+
+    class Expensive:
+        def __repr__(self):
+            calls.append(1)
+            return "<expensive>"
+
+    err = FlexiFlowError("Boom", context=ErrorContext().add("obj", Expensive()))
+    assert calls == []
+    assert err.args == ("Boom",)
+
+    assert "obj=<expensive>" in str(err)
+    assert str(err) == str(err)
+    assert calls == [1]
+
+
+def test_error_pickle_keeps_structured_fields():
+    """Pickled errors keep what/why/fix/context and a short repr."""
+    import pickle
+
+    err = config_missing_field("name", "/path/to/config.yaml")
+    rendered = str(err)
+
+    clone = pickle.loads(pickle.dumps(err))
+    assert type(clone) is ConfigError
+    assert clone.args == ("Config missing required field: 'name'",)
+    assert clone.why == err.why
+    assert clone.context.items == err.context.items
+    assert clone._cached_msg is None
+    assert str(clone) == rendered
+    assert repr(clone) == "ConfigError(\"Config missing required field: 'name'\")"
+
+
 def test_error_inheritance():
     """All error types inherit from FlexiFlowError."""
     assert issubclass(ConfigError, FlexiFlowError)
@@ -143,6 +178,16 @@ def test_state_not_found_truncates_long_list():
     assert "+15 more" in msg or "(+15 more)" in msg
 
 
+def test_state_not_found_context_unaffected_by_later_mutation():
+    """Mutating the caller's list after creating the error doesn't change it."""
+    states = ["InitialState", "ProcessingRequest"]
+    err = state_not_found("BadState", states)
+    states[0] = "MUTATED"
+
+    assert "MUTATED" not in str(err)
+    assert err.context.items["valid_states"] == ["InitialState", "ProcessingRequest"]
+
+
 def test_state_not_found_is_state_error():
     """state_not_found returns StateError."""
     err = state_not_found("BadState", ["Good"])
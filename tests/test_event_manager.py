@@ -137,7 +137,7 @@ async def test_subscribe_returns_handle():
     handle = await bus.subscribe("x", "c", h)
     assert isinstance(handle, SubscriptionHandle)
     assert handle.event_name == "x"
-    assert handle.subscription_id  # non-empty uuid string
+    assert handle.subscription_id  # positive int
 
 
 async def test_unsubscribe_removes_handler():
@@ -173,7 +173,7 @@ async def test_unsubscribe_idempotent():
 def test_unsubscribe_unknown_handle():
     """unsubscribe() with unknown handle returns False."""
     bus = AsyncEventManager()
-    fake_handle = SubscriptionHandle(event_name="x", subscription_id="nonexistent")
+    fake_handle = SubscriptionHandle(event_name="x", subscription_id=-1)
     assert bus.unsubscribe(fake_handle) is False
 
 
@@ -209,3 +209,288 @@ async def test_unsubscribe_all_unknown_component():
     """unsubscribe_all() with unknown component returns 0."""
     bus = AsyncEventManager()
     assert bus.unsubscribe_all("nonexistent") == 0
+
+
+async def test_has_subscribers():
+    """has_subscribers reflects subscribe/unsubscribe."""
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    assert bus.has_subscribers("x") is False
+    first = await bus.subscribe("x", "a", h)
+    second = await bus.subscribe("x", "b", h)
+    assert bus.has_subscribers("x") is True
+
+    # Stays True until the last handler is removed
+    bus.unsubscribe(first)
+    assert bus.has_subscribers("x") is True
+    bus.unsubscribe(second)
+    assert bus.has_subscribers("x") is False
+
+
+async def test_same_priority_keeps_subscription_order():
+    """Handlers with equal priority run in the order they subscribed."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def make(tag):
+        async def h(_):
+            seen.append(tag)
+
+        return h
+
+    await bus.subscribe("x", "c", make("a5"), priority=5)
+    await bus.subscribe("x", "c", make("b2"), priority=2)
+    await bus.subscribe("x", "c", make("c5"), priority=5)
+    await bus.subscribe("x", "c", make("d2"), priority=2)
+
+    await bus.publish("x")
+    assert seen == ["b2", "d2", "a5", "c5"]
+
+
+async def test_subscription_records_have_no_instance_dict():
+    """Subscriptions and handles are slotted and immutable."""
+    import dataclasses
+
+    from flexiflow.event_manager import Subscription
+
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    handle = await bus.subscribe("x", "c", h)
+    assert not hasattr(handle, "__dict__")
+    assert "__dict__" not in dir(Subscription)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        handle.event_name = "y"  # type: ignore[misc]
+
+
+async def test_subscription_ids_unique_across_managers():
+    """A handle from one manager never removes another manager's subscription."""
+    bus_a = AsyncEventManager()
+    bus_b = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    handle_a = await bus_a.subscribe("x", "c", h)
+    handle_b = await bus_b.subscribe("x", "c", h)
+
+    assert handle_a.subscription_id != handle_b.subscription_id
+    assert bus_b.unsubscribe(handle_a) is False
+    assert bus_b.has_subscribers("x")
+
+
+async def test_unsubscribe_with_handle_without_priority():
+    """A handle built without a priority still finds its subscription."""
+    bus = AsyncEventManager()
+    called = []
+
+    async def h(_):
+        called.append(1)
+
+    handle = await bus.subscribe("x", "c", h, priority=4)
+    assert handle.priority == 4
+
+    bare = SubscriptionHandle(event_name="x", subscription_id=handle.subscription_id)
+    assert bus.unsubscribe(bare) is True
+    assert bus.unsubscribe_all("c") == 0
+
+    await bus.publish("x")
+    assert called == []
+
+
+async def test_unsubscribe_middle_keeps_order_of_others():
+    """Removing one subscription leaves the others in subscription order."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def make(tag):
+        async def h(_):
+            seen.append(tag)
+
+        return h
+
+    await bus.subscribe("x", "a", make("a"))
+    handle = await bus.subscribe("x", "b", make("b"))
+    await bus.subscribe("x", "c", make("c"))
+    assert handle.component_name == "b"
+
+    assert bus.unsubscribe(handle) is True
+    assert bus.unsubscribe_all("b") == 0
+
+    await bus.publish("x")
+    assert seen == ["a", "c"]
+
+
+async def test_filters_apply_again_after_resubscribe():
+    """Filter bookkeeping survives removing and re-adding filtered handlers."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data)
+
+    only_ok = lambda _e, d: d == "ok"  # noqa: E731
+    handle = await bus.subscribe("x", "c", h, filter_fn=only_ok)
+    await bus.publish("x", "skip")
+    assert seen == []
+
+    bus.unsubscribe(handle)
+    await bus.subscribe("x", "c", h)
+    await bus.publish("x", "skip")
+    assert seen == ["skip"]
+
+    await bus.subscribe("x", "c", h, filter_fn=only_ok)
+    await bus.publish("x", "skip")
+    assert seen == ["skip", "skip"]
+
+
+async def test_concurrent_single_handler_error_modes():
+    """A lone concurrent handler follows the same on_error rules as several."""
+    bus = AsyncEventManager()
+    failures = []
+
+    async def boom(_):
+        raise RuntimeError("boom")
+
+    async def on_failed(data):
+        failures.append(data["component_name"])
+
+    await bus.subscribe("x", "bad", boom)
+    await bus.subscribe("event.handler.failed", "observer", on_failed)
+
+    await bus.publish("x", delivery="concurrent")
+    assert failures == ["bad"]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await bus.publish("x", delivery="concurrent", on_error="raise")
+
+
+async def test_concurrent_single_handler_runs_in_own_context():
+    """A lone concurrent handler gets its own Task context, like several do."""
+    import contextvars
+
+    var = contextvars.ContextVar("var", default="caller")
+    bus = AsyncEventManager()
+
+    async def setter(_):
+        var.set("handler")
+
+    await bus.subscribe("x", "c", setter)
+    await bus.publish("x", delivery="concurrent")
+    assert var.get() == "caller"
+
+
+async def test_handler_errors_not_logged_when_error_level_disabled():
+    """Handler errors are not passed to a logger that filters out ERROR."""
+    import logging
+
+    calls = []
+
+    class QuietLogger:
+        def isEnabledFor(self, level):
+            return level > logging.ERROR
+
+        def error(self, *args):
+            calls.append(args)
+
+    bus = AsyncEventManager(logger=QuietLogger())
+
+    async def boom(_):
+        raise RuntimeError("boom")
+
+    await bus.subscribe("x", "a", boom)
+    await bus.subscribe("x", "b", boom)
+
+    await bus.publish("x")
+    await bus.publish("x", delivery="concurrent")
+    assert calls == []
+
+
+async def test_concurrent_raise_does_not_wait_for_slow_handlers():
+    """Concurrent raise mode surfaces the first failure without waiting for the rest."""
+    import asyncio
+
+    bus = AsyncEventManager()
+    release = asyncio.Event()
+    finished = []
+
+    async def slow(_):
+        await release.wait()
+        finished.append("slow")
+
+    async def boom(_):
+        raise RuntimeError("boom")
+
+    await bus.subscribe("x", "slow", slow, priority=1)
+    await bus.subscribe("x", "bad", boom, priority=2)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await bus.publish("x", delivery="concurrent", on_error="raise")
+    assert finished == []
+
+    # The slow handler is not cancelled
+    release.set()
+    await asyncio.sleep(0)
+    assert finished == ["slow"]
+
+
+async def test_subscription_changes_during_publish_apply_to_next_publish():
+    """Handlers may (un)subscribe mid-delivery; the running publish is unaffected."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def late(_):
+        seen.append("late")
+
+    async def first(_):
+        seen.append("first")
+        bus.unsubscribe(first_handle)
+        await bus.subscribe("x", "c", late)
+
+    async def second(_):
+        seen.append("second")
+
+    first_handle = await bus.subscribe("x", "c", first, priority=1)
+    await bus.subscribe("x", "c", second, priority=2)
+
+    await bus.publish("x")
+    assert seen == ["first", "second"]
+
+    seen.clear()
+    await bus.publish("x")
+    assert seen == ["second", "late"]
+
+
+async def test_publish_entry_points_match_publish_modes():
+    """publish_sequential/publish_concurrent deliver like publish()."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h1(data):
+        seen.append(("h1", data))
+
+    async def h2(data):
+        seen.append(("h2", data))
+
+    async def boom(_):
+        raise RuntimeError("boom")
+
+    await bus.subscribe("x", "c", h2, priority=2)
+    await bus.subscribe("x", "c", h1, priority=1)
+
+    await bus.publish_sequential("x", 1)
+    assert seen == [("h1", 1), ("h2", 1)]
+
+    seen.clear()
+    await bus.publish_concurrent("x", 2)
+    assert sorted(seen) == [("h1", 2), ("h2", 2)]
+
+    await bus.subscribe("y", "c", boom)
+    await bus.publish_sequential("y")
+    with pytest.raises(RuntimeError):
+        await bus.publish_sequential("y", raise_on_error=True)
@@ -44,6 +44,18 @@ def test_example_states_importable():
     assert Failed.__name__ == "Failed"
 
 
+async def test_example_states_return_shared_instances():
+    """Transitions return the module-level singleton states."""
+    import states
+
+    proceeded, nxt = await states.IDLE.handle_message({"type": "start_job"}, None)
+    assert proceeded is True
+    assert nxt is states.PROCESSING
+
+    _, again = await states.Idle().handle_message({"type": "start_job"}, None)
+    assert again is nxt
+
+
 def test_example_config_loads(example_config):
     """Example config loads and registers custom states."""
     assert example_config.name == "job_processor"
@@ -191,3 +203,27 @@ async def test_example_restore_from_snapshot(example_config, example_conn):
     # Can continue from restored state
     await component.handle_message({"type": "complete"})
     assert component.state_machine.current_state.__class__.__name__ == "Complete"
+
+
+async def test_example_writer_survives_failed_flush(example_config, capsys):
+    """A failed flush is reported and the writer keeps draining the queue."""
+    import asyncio
+
+    from app import PruneScheduler, Transition, snapshot_writer
+
+    conn = sqlite3.connect(":memory:")
+    conn.close()  # every flush now raises sqlite3.ProgrammingError
+
+    queue: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(
+        snapshot_writer(conn, queue, PruneScheduler(conn, example_config.name))
+    )
+    try:
+        for to_state in ("Processing", "Complete"):
+            queue.put_nowait(Transition(example_config.name, to_state))
+            await asyncio.wait_for(queue.join(), timeout=2)
+        assert not writer.done()
+    finally:
+        writer.cancel()
+
+    assert "failed to persist" in capsys.readouterr().out
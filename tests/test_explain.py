@@ -179,6 +179,17 @@ class TestExplainInvalidConfigs:
         assert not result.is_valid
         assert any("YAML" in e.what for e in result.errors)
 
+    def test_empty_file(self, tmp_path: Path):
+        """Empty file yields a single 'Config is empty' error."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("", encoding="utf-8")
+
+        result = explain(config_file)
+
+        assert not result.is_valid
+        assert [e.what for e in result.errors] == ["Config is empty"]
+        assert result.warnings == []
+
     def test_missing_name(self, tmp_path: Path):
         """Missing name field is caught."""
         config_file = tmp_path / "config.yaml"
@@ -373,6 +384,25 @@ class TestExplainDictInput:
         assert not result.is_valid
         assert any("name" in e.what.lower() for e in result.errors)
 
+    def test_every_failed_state_reported_once(self):
+        """Each kind of state resolution failure yields one error, in mapping order."""
+        config = {
+            "name": "test_component",
+            "initial_state": "InitialState",
+            "states": {
+                "Good": "fixture_states:FixtureInitial",
+                "NoSep": "fixture_states.FixtureInitial",
+                "NotStr": 42,
+                "Missing": "no_such_module_xyz:Thing",
+                "NotState": "fixture_states:__name__",
+            },
+        }
+
+        result = explain(config)
+
+        failed = [e.context["key"] for e in result.errors if "failed to resolve" in e.what]
+        assert failed == ["NoSep", "NotStr", "Missing", "NotState"]
+
 
 class TestExplainNoSideEffects:
     """Tests to verify explain() has no side effects."""
@@ -409,6 +439,88 @@ class TestExplainNoSideEffects:
         assert "FixtureInitial" not in new_states or "FixtureInitial" in initial_states
 
 
+class TestExplainCaching:
+    """Tests for reuse of parsed YAML across explain() calls."""
+
+    def test_repeat_explain_reuses_parse_and_sees_edits(self, tmp_path: Path):
+        """Unchanged files are parsed once; edits are picked up."""
+        import os
+
+        from flexiflow.config_loader import _parse_yaml_file
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "name: first\ninitial_state: InitialState\n"
+            'initial_state_resolution: ["builtin", "packs"]\n',
+            encoding="utf-8",
+        )
+
+        first = explain(config_file)
+        misses = _parse_yaml_file.cache_info().misses
+        first.initial_state_resolution.append("mutated")
+
+        second = explain(config_file)
+        assert _parse_yaml_file.cache_info().misses == misses
+        assert second.initial_state_resolution == ["builtin", "packs"]
+
+        config_file.write_text("name: second_name\ninitial_state: InitialState\n", encoding="utf-8")
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert explain(config_file).name == "second_name"
+
+    def test_importing_flexiflow_does_not_import_yaml(self):
+        """PyYAML is only imported once a config file is parsed."""
+        import subprocess
+        import sys
+
+        code = "import sys, flexiflow; print('yaml' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_uses_libyaml_loader_when_available(self):
+        """Config parsing uses the C SafeLoader when PyYAML has libyaml."""
+        import yaml
+
+        from flexiflow import config_loader
+
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        assert config_loader._safe_loader() is expected
+
+
+class TestImportSymbolCache:
+    """Tests for reuse of resolved dotted paths across explain() calls."""
+
+    def test_cached_symbol_follows_module_rebinding(self, monkeypatch):
+        """A cached symbol is dropped when the module rebinds the name."""
+        import fixture_states
+
+        from flexiflow.explain import _try_import_symbol
+
+        original, error = _try_import_symbol("fixture_states:FixtureInitial")
+        assert error is None
+        assert _try_import_symbol("fixture_states:FixtureInitial")[0] is original
+
+        class Replacement:
+            pass
+
+        monkeypatch.setattr(fixture_states, "FixtureInitial", Replacement)
+        assert _try_import_symbol("fixture_states:FixtureInitial")[0] is Replacement
+
+    def test_failures_are_not_cached(self, tmp_path: Path, monkeypatch):
+        """A module that appears after a failed lookup resolves next time."""
+        from flexiflow.explain import _try_import_symbol
+
+        _, error = _try_import_symbol("late_module_for_cache_test:Thing")
+        assert error is not None
+
+        (tmp_path / "late_module_for_cache_test.py").write_text("Thing = 1\n", encoding="utf-8")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        assert _try_import_symbol("late_module_for_cache_test:Thing") == (1, None)
+
+
 class TestExplainPackInfo:
     """Tests for pack info in explain() output (v0.4.0+)."""
 
@@ -437,6 +549,57 @@ class TestExplainPackInfo:
         assert "AnotherFixture" in result.packs[0].provided_keys
         assert "FixtureInitial" in result.packs[0].provided_keys
 
+    def test_str_subclass_pack_keys_do_not_raise(self):
+        """Pack keys and names that aren't exact str are kept, not interned."""
+        from flexiflow.statepack import StateSpec
+        from fixture_states import FixtureInitial
+
+        class Key(str):
+            pass
+
+        class SubclassKeyPack:
+            name = Key("subclass_pack")
+
+            def provides(self):
+                return {Key("FixtureInitial"): StateSpec(FixtureInitial)}
+
+            def transitions(self):
+                return []
+
+            def depends_on(self):
+                return set()
+
+        result = explain(
+            {
+                "name": "test_component",
+                "packs": [SubclassKeyPack()],
+                "initial_state": "InitialState",
+                "rules": [],
+            }
+        )
+
+        assert result.state_providers == {"FixtureInitial": "subclass_pack"}
+        assert result.pack_order == ["subclass_pack"]
+
+    def test_failed_states_mapping_skips_pack_info(self):
+        """A states: mapping with failed entries reports no mapping pack."""
+        config = {
+            "name": "test_component",
+            "states": {
+                "FixtureInitial": "fixture_states:FixtureInitial",
+                "Broken": "nonexistent.module:Broken",
+            },
+            "initial_state": "FixtureInitial",
+            "rules": [],
+        }
+
+        result = explain(config)
+
+        assert not result.is_valid
+        assert result.packs == []
+        assert result.state_providers == {}
+        assert any("'Broken' failed to resolve" in e.what for e in result.errors)
+
     def test_state_providers_mapping(self, tmp_path: Path):
         """state_providers maps state keys to pack names."""
         config_file = tmp_path / "config.yaml"
@@ -605,6 +768,23 @@ class TestExplainPackInfo:
         assert not result.is_valid
         assert any("Pack loading failed" in e.what for e in result.errors)
 
+    def test_pack_loading_error_keeps_structured_fields(self):
+        """Pack loading diagnostics carry the error's why/fix/context."""
+        config = {
+            "name": "test_component",
+            "packs": ["nonexistent.module:BadPack"],
+            "initial_state": "InitialState",
+            "rules": [],
+        }
+
+        result = explain(config)
+
+        diag = next(e for e in result.errors if "Pack loading failed" in e.what)
+        assert diag.level == "error"
+        assert diag.why
+        assert diag.fix
+        assert isinstance(diag.context, dict)
+
     def test_invalid_packs_type_makes_invalid(self):
         """packs: with wrong type makes config invalid."""
         config = {
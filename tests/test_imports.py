@@ -22,6 +22,20 @@ def test_load_symbol_valid():
     assert cls.__name__ == "FixtureInitial"
 
 
+def test_load_symbol_follows_module_rebinding(monkeypatch):
+    """Repeated loads reuse the resolution until the module rebinds the name."""
+    import fixture_states
+
+    original = load_symbol("fixture_states:FixtureInitial")
+    assert load_symbol("fixture_states:FixtureInitial") is original
+
+    class Replacement:
+        pass
+
+    monkeypatch.setattr(fixture_states, "FixtureInitial", Replacement)
+    assert load_symbol("fixture_states:FixtureInitial") is Replacement
+
+
 def test_load_symbol_missing_colon():
     """load_symbol raises ImportError_ if ':' is missing."""
     with pytest.raises(ImportError_, match="Invalid dotted path"):
@@ -297,3 +311,28 @@ def test_states_mapping_non_string_key_errors(tmp_path: Path):
 
     with pytest.raises(ConfigError, match="Invalid states entry"):
         ConfigLoader.load_component_config(config_file)
+
+
+# --- ConfigLoader.load_yaml caching tests ---
+
+
+def test_load_yaml_returns_independent_copies(tmp_path: Path):
+    """Cached parses are copied, so mutating a result doesn't leak."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("name: cached\nrules:\n  - a: 1\n", encoding="utf-8")
+
+    first = ConfigLoader.load_yaml(config_file)
+    first["rules"].append({"b": 2})
+
+    second = ConfigLoader.load_yaml(config_file)
+    assert second == {"name": "cached", "rules": [{"a": 1}]}
+
+
+def test_load_yaml_picks_up_edits(tmp_path: Path):
+    """Editing the file invalidates the cached parse."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("name: before\n", encoding="utf-8")
+    assert ConfigLoader.load_yaml(config_file)["name"] == "before"
+
+    config_file.write_text("name: after_edit\n", encoding="utf-8")
+    assert ConfigLoader.load_yaml(config_file)["name"] == "after_edit"
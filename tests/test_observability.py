@@ -171,3 +171,78 @@ async def test_handler_failed_concurrent_mode():
     assert all(n == "test.event" for n in event_names)
     assert "comp1" in component_names
     assert "comp2" in component_names
+
+
+async def test_rules_updated_fires():
+    """component.rules.updated fires when rules are added or extended."""
+    bus = AsyncEventManager()
+    events = []
+
+    async def capture(data):
+        events.append(data)
+
+    await bus.subscribe("component.rules.updated", "observer", capture)
+
+    component = AsyncComponent(name="test_comp", event_bus=bus)
+
+    await component.add_rule({"a": 1})
+    await component.update_rules([{"b": 2}, {"c": 3}])
+
+    assert events == [
+        {"component": "test_comp", "rules_count": 1},
+        {"component": "test_comp", "rules_count": 3},
+    ]
+
+
+async def test_handle_many_publishes_one_batch():
+    """handle_many publishes one state.changed.batch and no state.changed."""
+    bus = AsyncEventManager()
+    batches = []
+    singles = []
+
+    async def capture_batch(data):
+        batches.append(data)
+
+    async def capture_single(data):
+        singles.append(data)
+
+    await bus.subscribe("state.changed.batch", "observer", capture_batch)
+    await bus.subscribe("state.changed", "observer", capture_single)
+
+    component = AsyncComponent(
+        name="test_comp",
+        state_machine=StateMachine.from_name("InitialState"),
+        event_bus=bus,
+    )
+
+    # "confirm" from InitialState does not transition and is left out
+    transitions = await component.handle_many(
+        [{"type": "confirm"}, {"type": "start"}, {"type": "cancel"}]
+    )
+
+    assert transitions == [
+        {"from_state": "InitialState", "to_state": "AwaitingConfirmation"},
+        {"from_state": "AwaitingConfirmation", "to_state": "InitialState"},
+    ]
+    assert batches == [{"component": "test_comp", "transitions": transitions}]
+    assert singles == []
+
+
+async def test_handle_many_no_batch_without_transitions():
+    """state.changed.batch does NOT fire when no message transitions."""
+    bus = AsyncEventManager()
+    batches = []
+
+    async def capture(data):
+        batches.append(data)
+
+    await bus.subscribe("state.changed.batch", "observer", capture)
+
+    component = AsyncComponent(
+        name="test_comp",
+        state_machine=StateMachine.from_name("InitialState"),
+        event_bus=bus,
+    )
+
+    assert await component.handle_many([{"type": "confirm"}]) == []
+    assert batches == []
@@ -267,6 +267,19 @@ class TestCollectProvidedKeys:
         assert result["Idle"] == "session"
         assert result["Active"] == "session"
 
+    def test_precomputed_provides_skips_calls(self, monkeypatch):
+        """Passing provided= uses those results instead of calling provides()."""
+        pack = SessionPack()
+        provided = [pack.provides()]
+
+        def fail():
+            raise AssertionError("provides() called again")
+
+        monkeypatch.setattr(pack, "provides", fail)
+        result = collect_provided_keys([pack], provided=provided)
+
+        assert result == {"Idle": "session", "Active": "session"}
+
 
 # --- Tests for determinism ---
 
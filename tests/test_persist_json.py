@@ -131,3 +131,104 @@ def test_save_creates_parent_directories(tmp_path: Path):
     assert state_file.exists()
     snapshot = load_snapshot(state_file)
     assert snapshot.name == "test"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_saved_file_is_indented_utf8_json(tmp_path: Path, monkeypatch, use_orjson: bool):
+    """Both encoders write the same indented UTF-8 JSON that load_snapshot reads."""
+    import flexiflow.extras.persist_json as persist_json
+
+    if not use_orjson:
+        monkeypatch.setattr(persist_json, "orjson", None)
+    elif persist_json.orjson is None:
+        pytest.skip("orjson not installed")
+
+    state_file = tmp_path / "state.json"
+    component = AsyncComponent(
+        name="test",
+        rules=[{"k": "é", "n": 1}],
+        state_machine=StateMachine.from_name("InitialState"),
+    )
+    save_component(component, state_file, metadata={"m": [1, 2]})
+
+    data = json.loads(state_file.read_text(encoding="utf-8"))
+    assert data == {
+        "name": "test",
+        "current_state": "InitialState",
+        "rules": [{"k": "é", "n": 1}],
+        "metadata": {"m": [1, 2]},
+    }
+    assert state_file.read_text(encoding="utf-8").startswith('{\n  "name": "test"')
+    assert load_snapshot(state_file).rules == [{"k": "é", "n": 1}]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_wide_ints_and_non_finite_floats_roundtrip(
+    tmp_path: Path, monkeypatch, use_orjson: bool
+):
+    """Values orjson can't represent take the stdlib path instead of failing or becoming null."""
+    import math
+
+    import flexiflow.extras.persist_json as persist_json
+
+    if not use_orjson:
+        monkeypatch.setattr(persist_json, "orjson", None)
+    elif persist_json.orjson is None:
+        pytest.skip("orjson not installed")
+
+    state_file = tmp_path / "state.json"
+    component = AsyncComponent(
+        name="test",
+        rules=[{"big": 2**70, "neg": -(2**63) - 1}, {"x": float("nan"), "y": float("inf")}],
+        state_machine=StateMachine.from_name("InitialState"),
+    )
+    save_component(component, state_file)
+
+    rules = load_snapshot(state_file).rules
+    assert rules[0] == {"big": 2**70, "neg": -(2**63) - 1}
+    assert math.isnan(rules[1]["x"]) and rules[1]["y"] == float("inf")
+
+
+def test_save_replaces_existing_file_atomically(tmp_path: Path):
+    """Saving over an existing snapshot leaves only the new file behind."""
+    state_file = tmp_path / "state.json"
+    state_file.write_text("old contents", encoding="utf-8")
+
+    component = AsyncComponent(
+        name="test",
+        state_machine=StateMachine.from_name("InitialState"),
+    )
+    save_component(component, state_file)
+
+    assert load_snapshot(state_file).name == "test"
+    assert [f.name for f in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_failed_save_keeps_previous_file(tmp_path: Path):
+    """A snapshot that cannot be encoded leaves the old file untouched."""
+    state_file = tmp_path / "state.json"
+    state_file.write_text("old contents", encoding="utf-8")
+
+    component = AsyncComponent(
+        name="test",
+        state_machine=StateMachine.from_name("InitialState"),
+    )
+    with pytest.raises(TypeError):
+        save_component(component, state_file, metadata={"bad": object()})
+
+    assert state_file.read_text(encoding="utf-8") == "old contents"
+    assert [f.name for f in tmp_path.iterdir()] == ["state.json"]
+
+
+async def test_restore_shares_rules_until_mutated():
+    """restore_component does not copy rules; the first mutation copies them."""
+    snapshot = ComponentSnapshot(
+        name="shared", current_state="InitialState", rules=[{"r": 1}], metadata={}
+    )
+    restored = restore_component(snapshot, FlexiFlowEngine())
+    assert restored.rules is snapshot.rules
+
+    await restored.add_rule({"r": 2})
+
+    assert snapshot.rules == [{"r": 1}]
+    assert restored.rules == [{"r": 1}, {"r": 2}]
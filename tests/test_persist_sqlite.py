@@ -11,10 +11,18 @@ import pytest
 from flexiflow import PersistenceError
 from flexiflow.extras.persist_json import ComponentSnapshot
 from flexiflow.extras.persist_sqlite import (
+    SnapshotStore,
+    async_save_snapshot,
+    configure_connection,
     list_snapshots,
+    list_transitions,
     load_latest_snapshot,
     prune_snapshots,
+    prune_transitions,
     save_snapshot,
+    save_snapshots,
+    save_transition,
+    save_transitions,
 )
 
 
@@ -148,6 +156,43 @@ def test_invalid_json_raises_valueerror(conn: sqlite3.Connection):
         load_latest_snapshot(conn, "corrupt")
 
 
+@pytest.mark.parametrize("json1", [True, False])
+def test_list_snapshots_reports_invalid_and_missing_state(
+    conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch, json1: bool
+):
+    """Malformed rows list as 'invalid', rows without current_state as 'unknown'.
+
+    Rows with NaN (valid for the stdlib encoder, rejected by json_valid) still
+    report their state.
+    """
+    from flexiflow.extras import persist_sqlite
+
+    if not json1:
+        # Same path a SQLite build without JSON1 takes.
+        monkeypatch.setattr(
+            persist_sqlite,
+            "_LIST_SNAPSHOTS_SQL",
+            "SELECT flexiflow_no_such_function(id) FROM flexiflow_snapshots",
+        )
+
+    save_snapshot(conn, ComponentSnapshot("mixed", "InitialState", [], {}))
+    now = datetime.now(timezone.utc).isoformat()
+    conn.executemany(
+        """
+        INSERT INTO flexiflow_snapshots (component_name, snapshot_json, created_at)
+        VALUES (?, ?, ?)
+        """,
+        [
+            ("mixed", json.dumps({"current_state": "Nan", "rules": [{"x": float("nan")}]}), now),
+            ("mixed", json.dumps({"name": "mixed"}), now),
+            ("mixed", "not json {{", now),
+        ],
+    )
+
+    states = [entry["current_state"] for entry in list_snapshots(conn, "mixed")]
+    assert states == ["invalid", "unknown", "Nan", "InitialState"]
+
+
 def test_multiple_components_isolated(conn: sqlite3.Connection):
     """Snapshots for different components don't interfere."""
     snap_a = ComponentSnapshot(
@@ -224,6 +269,21 @@ def test_prune_snapshots_keeps_recent(conn: sqlite3.Connection):
     assert history[2]["current_state"] == "State7"
 
 
+def test_prune_snapshots_orders_by_created_at_not_id(conn: sqlite3.Connection):
+    """Backfilled (older, later-inserted) rows are pruned by timestamp."""
+    for day in (5, 6, 1, 2):  # rows 3 and 4 are backfilled history
+        snapshot = ComponentSnapshot(
+            name="backfilled", current_state=f"Day{day}", rules=[], metadata={}
+        )
+        save_snapshot(conn, snapshot, created_at=datetime(2024, 1, day, tzinfo=timezone.utc))
+
+    deleted = prune_snapshots(conn, "backfilled", keep_last=2)
+
+    assert deleted == 2
+    history = list_snapshots(conn, "backfilled", limit=10)
+    assert [h["current_state"] for h in history] == ["Day6", "Day5"]
+
+
 def test_prune_snapshots_noop_when_few(conn: sqlite3.Connection):
     """prune_snapshots does nothing if fewer than keep_last exist."""
     # Create 2 snapshots
@@ -261,3 +321,385 @@ def test_prune_snapshots_isolates_components(conn: sqlite3.Connection):
     # comp_a has 2, comp_b still has 5
     assert len(list_snapshots(conn, "comp_a", limit=10)) == 2
     assert len(list_snapshots(conn, "comp_b", limit=10)) == 5
+
+
+def test_save_without_commit_joins_caller_transaction(conn: sqlite3.Connection):
+    """save_snapshot(commit=False) leaves the transaction to the caller."""
+    snapshot = ComponentSnapshot(name="batched", current_state="S", rules=[], metadata={})
+
+    conn.execute("BEGIN IMMEDIATE")
+    save_snapshot(conn, snapshot, commit=False)
+    save_snapshot(conn, snapshot, commit=False)
+    assert conn.in_transaction
+
+    conn.rollback()
+    assert list_snapshots(conn, "batched") == []
+
+    conn.execute("BEGIN IMMEDIATE")
+    save_snapshot(conn, snapshot, commit=False)
+    conn.commit()
+    assert len(list_snapshots(conn, "batched")) == 1
+
+
+def test_load_latest_applies_newer_transition(conn: sqlite3.Connection):
+    """load_latest_snapshot overlays the newest transition on the full snapshot."""
+    snapshot = ComponentSnapshot(
+        name="delta", current_state="Idle", rules=[{"r": 1}], metadata={}
+    )
+    save_snapshot(conn, snapshot, created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    save_transition(conn, "delta", "Processing", created_at=datetime(2024, 1, 2, tzinfo=timezone.utc))
+    save_transition(conn, "delta", "Complete", created_at=datetime(2024, 1, 3, tzinfo=timezone.utc))
+
+    loaded = load_latest_snapshot(conn, "delta")
+    assert loaded is not None
+    assert loaded.current_state == "Complete"
+    assert loaded.rules == [{"r": 1}]
+
+
+def test_load_latest_ignores_older_transition(conn: sqlite3.Connection):
+    """Transitions recorded before the latest full snapshot are superseded."""
+    save_transition(conn, "delta", "Processing", created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    snapshot = ComponentSnapshot(name="delta", current_state="Idle", rules=[], metadata={})
+    save_snapshot(conn, snapshot, created_at=datetime(2024, 1, 2, tzinfo=timezone.utc))
+
+    loaded = load_latest_snapshot(conn, "delta")
+    assert loaded is not None
+    assert loaded.current_state == "Idle"
+
+
+def test_list_and_prune_transitions(conn: sqlite3.Connection):
+    """Transitions are listed newest first and can be pruned."""
+    for i in range(5):
+        save_transition(
+            conn, "trans", f"State{i}", created_at=datetime(2024, 1, i + 1, tzinfo=timezone.utc)
+        )
+
+    history = list_transitions(conn, "trans", limit=2)
+    assert [h["current_state"] for h in history] == ["State4", "State3"]
+
+    assert prune_transitions(conn, "trans", keep_last=2) == 3
+    assert [h["current_state"] for h in list_transitions(conn, "trans")] == ["State4", "State3"]
+
+
+def test_save_snapshots_batch(conn: sqlite3.Connection):
+    """save_snapshots inserts every snapshot; the last one is the latest."""
+    snapshots = [
+        ComponentSnapshot(name="batch", current_state=f"State{i}", rules=[], metadata={})
+        for i in range(700)
+    ]
+
+    assert save_snapshots(conn, snapshots) == 700
+
+    assert len(list_snapshots(conn, "batch", limit=1000)) == 700
+    latest = load_latest_snapshot(conn, "batch")
+    assert latest is not None
+    assert latest.current_state == "State699"
+
+
+def test_save_transitions_batch(conn: sqlite3.Connection):
+    """save_transitions records every transition; the last one wins on load."""
+    save_snapshot(
+        conn,
+        ComponentSnapshot(name="batch", current_state="Idle", rules=[], metadata={}),
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+    count = save_transitions(conn, [("batch", "Processing"), ("batch", "Complete")])
+    assert count == 2
+
+    latest = load_latest_snapshot(conn, "batch")
+    assert latest is not None
+    assert latest.current_state == "Complete"
+    assert save_transitions(conn, []) == 0
+
+
+def test_snapshot_stored_as_compact_json_text():
+    """Snapshot rows are compact JSON text that the standard json module reads."""
+    conn = sqlite3.connect(":memory:")
+    snapshot = ComponentSnapshot(
+        name="c", current_state="InitialState", rules=[{"k": "é", "n": 1}], metadata={}
+    )
+    save_snapshot(conn, snapshot)
+
+    (stored,) = conn.execute("SELECT snapshot_json FROM flexiflow_snapshots").fetchone()
+    assert isinstance(stored, str)
+    assert ", " not in stored and ": " not in stored
+    assert json.loads(stored)["rules"] == [{"k": "é", "n": 1}]
+
+
+def test_snapshot_roundtrip_without_orjson(monkeypatch):
+    """The stdlib json fallback writes and reads the same format."""
+    import flexiflow.extras.persist_sqlite as persist_sqlite
+
+    monkeypatch.setattr(persist_sqlite, "orjson", None)
+    conn = sqlite3.connect(":memory:")
+    snapshot = ComponentSnapshot(
+        name="c", current_state="InitialState", rules=[{"k": "v"}], metadata={"m": 1}
+    )
+    save_snapshot(conn, snapshot)
+
+    loaded = load_latest_snapshot(conn, "c")
+    assert loaded.rules == [{"k": "v"}]
+    assert loaded.metadata == {"m": 1}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_snapshot_with_non_str_rule_keys(monkeypatch, use_orjson: bool):
+    """Int and bool keys (as YAML produces) are saved as strings by both encoders."""
+    import flexiflow.extras.persist_sqlite as persist_sqlite
+
+    if not use_orjson:
+        monkeypatch.setattr(persist_sqlite, "orjson", None)
+    elif persist_sqlite.orjson is None:
+        pytest.skip("orjson not installed")
+
+    conn = sqlite3.connect(":memory:")
+    snapshot = ComponentSnapshot(
+        name="c", current_state="InitialState", rules=[{1: "a"}, {True: "b"}], metadata={}
+    )
+    save_snapshot(conn, snapshot)
+
+    assert load_latest_snapshot(conn, "c").rules == [{"1": "a"}, {"true": "b"}]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_snapshot_with_wide_ints_and_non_finite_floats(monkeypatch, use_orjson: bool):
+    """Wide integers and NaN/Infinity save and reload under both encoders."""
+    import math
+
+    import flexiflow.extras.persist_json as persist_json
+    import flexiflow.extras.persist_sqlite as persist_sqlite
+
+    if not use_orjson:
+        monkeypatch.setattr(persist_sqlite, "orjson", None)
+        monkeypatch.setattr(persist_json, "orjson", None)
+    elif persist_sqlite.orjson is None:
+        pytest.skip("orjson not installed")
+
+    conn = sqlite3.connect(":memory:")
+    snapshot = ComponentSnapshot(
+        name="c",
+        current_state="InitialState",
+        rules=[{"big": 2**70}, {"x": float("nan"), "y": float("-inf")}],
+        metadata={},
+    )
+    save_snapshot(conn, snapshot)
+
+    rules = load_latest_snapshot(conn, "c").rules
+    assert rules[0] == {"big": 2**70}
+    assert math.isnan(rules[1]["x"]) and rules[1]["y"] == float("-inf")
+
+
+def test_latest_snapshot_lookup_uses_index_without_sort():
+    """Latest-snapshot lookup is served by the index with no temp B-tree sort."""
+    conn = sqlite3.connect(":memory:")
+    save_snapshot(
+        conn, ComponentSnapshot(name="c", current_state="InitialState", rules=[], metadata={})
+    )
+
+    plan = conn.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT snapshot_json, created_at FROM flexiflow_snapshots
+        WHERE component_name = ?
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1
+        """,
+        ("c",),
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_flexiflow_snapshots_component_created_id" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_ensure_table_replaces_old_index():
+    """Databases created with the old created_at-only index are upgraded."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE flexiflow_snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " component_name TEXT NOT NULL, snapshot_json TEXT NOT NULL, created_at TEXT NOT NULL)"
+    )
+    conn.execute(
+        "CREATE INDEX idx_flexiflow_snapshots_component_created"
+        " ON flexiflow_snapshots (component_name, created_at DESC)"
+    )
+    save_snapshot(
+        conn, ComponentSnapshot(name="c", current_state="InitialState", rules=[], metadata={})
+    )
+
+    names = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'flexiflow_snapshots'"
+        )
+    }
+    assert "idx_flexiflow_snapshots_component_created" not in names
+    assert "idx_flexiflow_snapshots_component_created_id" in names
+
+
+def test_schema_setup_runs_once_per_database(conn: sqlite3.Connection):
+    """After the first write, calls only probe sqlite_master instead of running DDL."""
+    snapshot = ComponentSnapshot(name="c", current_state="InitialState", rules=[], metadata={})
+    save_snapshot(conn, snapshot)
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    save_snapshot(conn, snapshot, commit=False)
+    load_latest_snapshot(conn, "c")
+    conn.set_trace_callback(None)
+
+    assert not [sql for sql in statements if "CREATE" in sql or "DROP" in sql]
+
+
+def test_read_only_connection_reads_legacy_indexed_db(tmp_path):
+    """Reads don't migrate indexes, so a mode=ro connection works on old databases."""
+    path = tmp_path / "legacy.db"
+    writer = sqlite3.connect(path)
+    writer.execute(
+        "CREATE TABLE flexiflow_snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " component_name TEXT NOT NULL, snapshot_json TEXT NOT NULL, created_at TEXT NOT NULL)"
+    )
+    writer.execute(
+        "CREATE TABLE flexiflow_transitions (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " component_name TEXT NOT NULL, to_state TEXT NOT NULL, created_at TEXT NOT NULL)"
+    )
+    writer.execute(
+        "CREATE INDEX idx_flexiflow_snapshots_component_created"
+        " ON flexiflow_snapshots (component_name, created_at DESC)"
+    )
+    writer.execute(
+        "INSERT INTO flexiflow_snapshots (component_name, snapshot_json, created_at)"
+        " VALUES (?, ?, ?)",
+        ("c", json.dumps({"name": "c", "current_state": "InitialState"}), "2024-01-01"),
+    )
+    writer.commit()
+    writer.close()
+
+    reader = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    assert load_latest_snapshot(reader, "c").current_state == "InitialState"
+    assert [h["current_state"] for h in list_snapshots(reader, "c")] == ["InitialState"]
+    assert list_transitions(reader, "c") == []
+    reader.close()
+
+
+def test_configure_connection_enables_wal(tmp_path):
+    """configure_connection switches a file database to WAL + synchronous=NORMAL."""
+    conn = sqlite3.connect(tmp_path / "state.db")
+
+    assert configure_connection(conn) == "wal"
+    assert configure_connection(conn) == "wal"  # idempotent
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    save_snapshot(
+        conn, ComponentSnapshot(name="c", current_state="InitialState", rules=[], metadata={})
+    )
+    assert load_latest_snapshot(conn, "c").current_state == "InitialState"
+    conn.close()
+
+
+def test_configure_connection_in_memory_keeps_memory_journal(conn):
+    """In-memory databases cannot use WAL; the effective mode is reported."""
+    assert configure_connection(conn) == "memory"
+
+
+def test_snapshot_store_routes_reads_and_writes(tmp_path):
+    """SnapshotStore writes via its writer and reads via the read-only pool."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with SnapshotStore(tmp_path / "state.db", pool_size=2) as store:
+        store.save_snapshot(ComponentSnapshot("c", "InitialState", [], {}))
+        store.save_transition("c", "AwaitingConfirmation")
+
+        def read(_):
+            return store.load_latest_snapshot("c").current_state
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert set(pool.map(read, range(8))) == {"AwaitingConfirmation"}
+
+        with store._read() as reader:
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                reader.execute("DELETE FROM flexiflow_snapshots")
+
+        assert len(store.list_snapshots("c")) == 1
+        assert store.prune_transitions("c", keep_last=0) == 1
+        assert store.list_transitions("c") == []
+
+
+def test_snapshot_store_in_memory_reads_through_writer():
+    """A :memory: store has no read pool; reads see the writer's data."""
+    with SnapshotStore(":memory:") as store:
+        store.save_snapshots([ComponentSnapshot("m", "InitialState", [], {})])
+        assert store.load_latest_snapshot("m").current_state == "InitialState"
+
+
+async def test_async_save_snapshot_concurrent_producers(tmp_path):
+    """Concurrent async saves on one shared connection all land."""
+    import asyncio
+
+    conn = sqlite3.connect(tmp_path / "state.db", check_same_thread=False)
+    snapshots = [ComponentSnapshot("c", f"State{i}", [], {}) for i in range(20)]
+
+    row_ids = await asyncio.gather(*(async_save_snapshot(conn, s) for s in snapshots))
+
+    assert len(set(row_ids)) == 20
+    assert len(list_snapshots(conn, "c", limit=50)) == 20
+    conn.close()
+
+
+async def test_async_save_snapshot_locks_per_connection(tmp_path):
+    """A held write on one connection doesn't block saves on another."""
+    import asyncio
+
+    from flexiflow.extras import persist_sqlite
+
+    conn_a = sqlite3.connect(tmp_path / "a.db", check_same_thread=False)
+    conn_b = sqlite3.connect(tmp_path / "b.db", check_same_thread=False)
+    snapshot = ComponentSnapshot("c", "InitialState", [], {})
+
+    with persist_sqlite._connection_write_lock(conn_a):
+        blocked = asyncio.ensure_future(async_save_snapshot(conn_a, snapshot))
+        await asyncio.wait_for(async_save_snapshot(conn_b, snapshot), timeout=2)
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+    await asyncio.wait_for(blocked, timeout=2)
+    assert persist_sqlite._write_locks == {}
+    conn_a.close()
+    conn_b.close()
+
+
+async def test_async_save_snapshot_burst_uses_one_thread_per_connection(
+    tmp_path, monkeypatch
+):
+    """Producers queue on the loop, so only one save per connection is in a thread."""
+    import asyncio
+    import threading
+
+    from flexiflow.extras import persist_sqlite
+
+    active = 0
+    peak = 0
+    guard = threading.Lock()
+    locked_save = persist_sqlite._save_snapshot_locked
+
+    def counting_save(*args):
+        nonlocal active, peak
+        with guard:
+            active += 1
+            peak = max(peak, active)
+        try:
+            return locked_save(*args)
+        finally:
+            with guard:
+                active -= 1
+
+    monkeypatch.setattr(persist_sqlite, "_save_snapshot_locked", counting_save)
+    conn = sqlite3.connect(tmp_path / "state.db", check_same_thread=False)
+    snapshot = ComponentSnapshot("c", "InitialState", [], {})
+
+    await asyncio.gather(*(async_save_snapshot(conn, snapshot) for _ in range(20)))
+
+    assert peak == 1
+    assert persist_sqlite._async_write_locks == {}
+    conn.close()
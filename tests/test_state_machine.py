@@ -114,3 +114,33 @@ def test_custom_registry_isolation():
     # Default registry shouldn't have it
     with pytest.raises(StateError, match="Unknown state"):
         StateMachine.from_name("CustomState")
+
+
+def test_registry_membership():
+    """`name in registry` reflects register/unregister without sorting names."""
+    custom = StateRegistry()
+
+    class CustomState(State):
+        async def handle_message(self, message, component):
+            return True, self
+
+    assert "CustomState" not in custom
+    custom.register("CustomState", CustomState)
+    assert "CustomState" in custom
+    custom.unregister("CustomState")
+    assert "CustomState" not in custom
+
+
+async def test_component_current_state_name_tracks_state():
+    """AsyncComponent.current_state_name follows transitions and direct assignment."""
+    from flexiflow.component import AsyncComponent
+    from flexiflow.state_machine import ErrorHandling
+
+    component = AsyncComponent(name="c", state_machine=StateMachine.from_name("InitialState"))
+    assert component.current_state_name == "InitialState"
+
+    await component.handle_message({"type": "start"})
+    assert component.current_state_name == "AwaitingConfirmation"
+
+    component.state_machine.current_state = ErrorHandling()
+    assert component.current_state_name == "ErrorHandling"